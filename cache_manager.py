@@ -7,9 +7,18 @@ and LLM-processed events to avoid redundant processing.
 
 import os
 import json
-from typing import Dict, Optional, List
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
+# Optional: orjson parses/serializes cache files several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class CacheManager:
     """Manager for caching scraped and processed historical data."""
@@ -22,6 +31,43 @@ class CacheManager:
             cache_dir: Root directory for cache files
         """
         self.cache_dir = cache_dir
+        # Files already read or written in this run, keyed by path
+        self._mem: Dict[str, Dict] = {}
+
+    def _read_json(self, cache_file: str) -> Dict:
+        """
+        Read a cache file, memoized for the rest of the run.
+
+        Args:
+            cache_file: Path from _get_cache_path()
+
+        Returns:
+            Parsed cache file contents
+        """
+        if cache_file not in self._mem:
+            if orjson is not None:
+                with open(cache_file, 'rb') as f:
+                    self._mem[cache_file] = orjson.loads(f.read())
+            else:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    self._mem[cache_file] = json.load(f)
+        return self._mem[cache_file]
+
+    def _write_json(self, cache_file: str, cache_data: Dict) -> None:
+        """
+        Write a cache file and remember its contents.
+
+        Args:
+            cache_file: Path from _get_cache_path()
+            cache_data: JSON-serializable cache contents
+        """
+        if orjson is not None:
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+        self._mem[cache_file] = cache_data
 
     def _get_cache_path(self, region: str, year: int, cache_type: str) -> str:
         """
@@ -60,8 +106,7 @@ class CacheManager:
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
 
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
+        self._write_json(cache_file, cache_data)
 
     def load_raw_data(self, region: str, year: int) -> Optional[Dict]:
         """
@@ -76,12 +121,11 @@ class CacheManager:
         """
         cache_file = self._get_cache_path(region, year, "Raw")
 
-        if not os.path.exists(cache_file):
+        if cache_file not in self._mem and not os.path.exists(cache_file):
             return None
 
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._read_json(cache_file)
         except Exception as e:
             print(f"Error loading raw cache for {region}_{year}: {e}")
             return None
@@ -104,8 +148,7 @@ class CacheManager:
             "timestamp": datetime.utcnow().isoformat() + "Z"
         }
 
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
+        self._write_json(cache_file, cache_data)
 
     def load_llm_data(self, region: str, year: int) -> Optional[List[Dict]]:
         """
@@ -120,13 +163,11 @@ class CacheManager:
         """
         cache_file = self._get_cache_path(region, year, "LLM")
 
-        if not os.path.exists(cache_file):
+        if cache_file not in self._mem and not os.path.exists(cache_file):
             return None
 
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                return cache_data.get("events", [])
+            return self._read_json(cache_file).get("events", [])
         except Exception as e:
             print(f"Error loading LLM cache for {region}_{year}: {e}")
             return None
@@ -154,6 +195,8 @@ class CacheManager:
             region: Region to clear (None for all regions)
             year: Year to clear (None for all years)
         """
+        self._mem.clear()
+
         if region is None:
             # Clear all cache
             if os.path.exists(self.cache_dir):
@@ -221,4 +264,84 @@ class CacheManager:
         }
 
 
+class ContentCache:
+    """
+    SQLite-backed key-value cache addressed by content hash.
+
+    Keys are sha256 digests of the request inputs (URL/params or
+    model/prompt), so identical network and LLM calls share one entry
+    no matter which region or driver script issued them.
+    """
 
+    def __init__(self, db_path: str = os.path.join("cache", "content.db")):
+        """
+        Initialize content cache.
+
+        Args:
+            db_path: Path to the SQLite cache database
+        """
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self.conn.commit()
+        # One connection is shared by scraper/LLM worker threads
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> bytes:
+        """
+        Build a cache key from request inputs.
+
+        Args:
+            parts: Inputs identifying the request (e.g. url, model, prompt)
+
+        Returns:
+            sha256 digest of the inputs
+        """
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: bytes, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable value
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False))
+            )
+            self.conn.commit()
+
+    def delete(self, key: bytes) -> None:
+        """
+        Remove a cached value (no-op if absent).
+
+        Args:
+            key: Key from make_key()
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self.conn.commit()
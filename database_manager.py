@@ -6,10 +6,99 @@ and querying historical events and periods.
 """
 
 import os
-from typing import List, Dict, Optional
-from sqlalchemy import create_engine, text
+import sqlite3
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Tuple
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
+# Connection pool settings for server databases (e.g. PostgreSQL); SQLite
+# keeps SQLAlchemy's default pool
+POOL_OPTIONS = {"pool_size": 10, "max_overflow": 20, "pool_recycle": 300, "pool_pre_ping": True}
+
+# Per-connection SQLite tuning for write-heavy scraping. synchronous=NORMAL is
+# only applied once the database is in WAL mode, where it stays crash-safe
+SQLITE_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune each new SQLite connection (WAL + relaxed fsync where writable)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        try:
+            mode = cursor.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        except sqlite3.OperationalError:
+            # Read-only database file (e.g. a bundled data.db): keep its journal mode
+            mode = None
+        if mode == "wal":
+            cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+
+# Insert statements are built once and shared by the single-row and bulk
+# methods, so SQLAlchemy reuses their compiled form (and sqlite3 its
+# prepared statement) instead of rebuilding them per call. Rows that hit a
+# unique index (e.g. the importer's (name, start_year[, region]) indexes on
+# the same database) are skipped; ON CONFLICT DO NOTHING is accepted by both
+# SQLite and PostgreSQL
+INSERT_EVENT_SQL = text("""
+    INSERT INTO events (
+        event_name, start_year, end_year, key_figures,
+        description, impact, category, region,
+        importance_level, source
+    )
+    VALUES (
+        :event_name, :start_year, :end_year, :key_figures,
+        :description, :impact, :category, :region,
+        :importance_level, :source
+    )
+    ON CONFLICT DO NOTHING
+""")
+
+INSERT_PERIOD_SQL = text("""
+    INSERT INTO periods (
+        period_name, start_year, end_year, period_type,
+        description, region
+    )
+    VALUES (
+        :period_name, :start_year, :end_year, :period_type,
+        :description, :region
+    )
+    ON CONFLICT DO NOTHING
+""")
+
+# Engines whose tables and indexes were already created in this process
+_schema_ready: Set[Engine] = set()
+
+
+@lru_cache(maxsize=None)
+def get_engine(connection_string: str) -> Engine:
+    """
+    Get the process-wide engine for a connection string.
+
+    Every DatabaseManager (and anything else using the same database) shares
+    one engine and its connection pool instead of opening its own.
+
+    Args:
+        connection_string: SQLAlchemy connection string
+
+    Returns:
+        Shared SQLAlchemy engine
+    """
+    if connection_string.startswith("sqlite"):
+        engine = create_engine(connection_string)
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+        return engine
+    return create_engine(connection_string, **POOL_OPTIONS)
+
 
 class DatabaseManager:
     """Manager for SQLite database operations."""
@@ -19,15 +108,24 @@ class DatabaseManager:
         Initialize database manager.
 
         Args:
-            connection_string: SQLite connection string (e.g., "sqlite:///data.db")
+            connection_string: SQLite connection string (e.g., "sqlite:///data.db");
+                defaults to the DATABASE_URL environment variable, then sqlite:///data.db
         """
         if connection_string is None:
-            connection_string = "sqlite:///data.db"
+            connection_string = os.getenv("DATABASE_URL", "sqlite:///data.db")
 
-        self.engine = create_engine(connection_string)
+        self.engine = get_engine(connection_string)
 
     def create_tables(self):
-        """Create database tables if they don't exist."""
+        """
+        Create database tables if they don't exist.
+
+        Runs once per engine per process, as a single transaction; later
+        calls (e.g. every new TimelineGenerator) are no-ops.
+        """
+        if self.engine in _schema_ready:
+            return
+
         create_events_table = """
         CREATE TABLE IF NOT EXISTS events (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -63,18 +161,20 @@ class DatabaseManager:
             "CREATE INDEX IF NOT EXISTS idx_events_region ON events(region);",
             "CREATE INDEX IF NOT EXISTS idx_events_category ON events(category);",
             "CREATE INDEX IF NOT EXISTS idx_events_importance ON events(importance_level);",
+            # Region-scoped timeline queries: region equality + start_year range/order
+            "CREATE INDEX IF NOT EXISTS idx_events_region_year ON events(region, start_year);",
             "CREATE INDEX IF NOT EXISTS idx_periods_start_year ON periods(start_year);",
             "CREATE INDEX IF NOT EXISTS idx_periods_region ON periods(region);",
             "CREATE INDEX IF NOT EXISTS idx_periods_type ON periods(period_type);"
         ]
 
-        with self.engine.connect() as conn:
+        with self.engine.begin() as conn:
             conn.execute(text(create_events_table))
             conn.execute(text(create_periods_table))
             for index_sql in create_indexes:
                 conn.execute(text(index_sql))
-            conn.commit()
 
+        _schema_ready.add(self.engine)
         print("Database tables and indexes created successfully!")
 
     def insert_event(self, event: Dict) -> Optional[int]:
@@ -85,27 +185,14 @@ class DatabaseManager:
             event: Event dictionary with all required fields
 
         Returns:
-            The ID of the inserted row, or None if failed
+            The ID of the inserted row, or None if failed or a duplicate was skipped
         """
-        insert_query = text("""
-            INSERT INTO events (
-                event_name, start_year, end_year, key_figures,
-                description, impact, category, region,
-                importance_level, source
-            )
-            VALUES (
-                :event_name, :start_year, :end_year, :key_figures,
-                :description, :impact, :category, :region,
-                :importance_level, :source
-            )
-        """)
-
         try:
             with self.engine.connect() as conn:
-                conn.execute(insert_query, event)
+                result = conn.execute(INSERT_EVENT_SQL, event)
                 conn.commit()
-                result = conn.execute(text("SELECT last_insert_rowid()"))
-                return result.fetchone()[0]
+                # No row was written when it duplicates an indexed one
+                return result.lastrowid if result.rowcount else None
         except SQLAlchemyError as e:
             print(f"Error inserting event {event.get('event_name')}: {e}")
             return None
@@ -153,25 +240,14 @@ class DatabaseManager:
             period: Period dictionary with all required fields
 
         Returns:
-            The ID of the inserted row, or None if failed
+            The ID of the inserted row, or None if failed or a duplicate was skipped
         """
-        insert_query = text("""
-            INSERT INTO periods (
-                period_name, start_year, end_year, period_type,
-                description, region
-            )
-            VALUES (
-                :period_name, :start_year, :end_year, :period_type,
-                :description, :region
-            )
-        """)
-
         try:
             with self.engine.connect() as conn:
-                conn.execute(insert_query, period)
+                result = conn.execute(INSERT_PERIOD_SQL, period)
                 conn.commit()
-                result = conn.execute(text("SELECT last_insert_rowid()"))
-                return result.fetchone()[0]
+                # No row was written when it duplicates an indexed one
+                return result.lastrowid if result.rowcount else None
         except SQLAlchemyError as e:
             print(f"Error inserting period {period.get('period_name')}: {e}")
             return None
@@ -180,31 +256,31 @@ class DatabaseManager:
         """
         Insert multiple events at once.
 
+        All rows go in a single executemany and transaction; if that fails
+        (e.g. one malformed event), events are retried one by one so the
+        valid ones are still stored.
+
         Args:
             events: List of event dictionaries
 
         Returns:
-            Number of successfully inserted events
+            Number of successfully inserted events (skipped duplicates excluded)
         """
-        insert_query = text("""
-            INSERT INTO events (
-                event_name, start_year, end_year, key_figures,
-                description, impact, category, region,
-                importance_level, source
-            )
-            VALUES (
-                :event_name, :start_year, :end_year, :key_figures,
-                :description, :impact, :category, :region,
-                :importance_level, :source
-            )
-        """)
+        if not events:
+            return 0
+
+        # One executemany in one transaction instead of a statement per event
+        try:
+            with self.engine.begin() as conn:
+                return conn.execute(INSERT_EVENT_SQL, events).rowcount
+        except SQLAlchemyError as e:
+            print(f"Bulk insert failed, inserting events one by one: {e}")
 
         count = 0
         with self.engine.connect() as conn:
             for event in events:
                 try:
-                    conn.execute(insert_query, event)
-                    count += 1
+                    count += conn.execute(INSERT_EVENT_SQL, event).rowcount
                 except SQLAlchemyError as e:
                     print(f"Error inserting event {event.get('event_name')}: {e}")
             conn.commit()
@@ -215,29 +291,29 @@ class DatabaseManager:
         """
         Insert multiple periods at once.
 
+        Uses a single executemany, falling back to per-period inserts on error.
+
         Args:
             periods: List of period dictionaries
 
         Returns:
-            Number of successfully inserted periods
+            Number of successfully inserted periods (skipped duplicates excluded)
         """
-        insert_query = text("""
-            INSERT INTO periods (
-                period_name, start_year, end_year, period_type,
-                description, region
-            )
-            VALUES (
-                :period_name, :start_year, :end_year, :period_type,
-                :description, :region
-            )
-        """)
+        if not periods:
+            return 0
+
+        # One executemany in one transaction instead of a statement per period
+        try:
+            with self.engine.begin() as conn:
+                return conn.execute(INSERT_PERIOD_SQL, periods).rowcount
+        except SQLAlchemyError as e:
+            print(f"Bulk insert failed, inserting periods one by one: {e}")
 
         count = 0
         with self.engine.connect() as conn:
             for period in periods:
                 try:
-                    conn.execute(insert_query, period)
-                    count += 1
+                    count += conn.execute(INSERT_PERIOD_SQL, period).rowcount
                 except SQLAlchemyError as e:
                     print(f"Error inserting period {period.get('period_name')}: {e}")
             conn.commit()
@@ -292,6 +368,32 @@ class DatabaseManager:
             print(f"Error querying events: {e}")
             return []
 
+    def get_event_keys(self, region: str = None) -> Set[Tuple[str, int]]:
+        """
+        Get the (event_name, start_year) pairs of stored events.
+
+        Used to check duplicates in memory instead of querying per event.
+
+        Args:
+            region: Filter by region (optional)
+
+        Returns:
+            Set of (event_name, start_year) tuples
+        """
+        query = "SELECT event_name, start_year FROM events"
+        params = {}
+
+        if region:
+            query += " WHERE region = :region"
+            params["region"] = region
+
+        try:
+            with self.engine.connect() as conn:
+                return {(row[0], row[1]) for row in conn.execute(text(query), params)}
+        except SQLAlchemyError as e:
+            print(f"Error querying event keys: {e}")
+            return set()
+
     def search_events_by_keyword(self, keyword: str, region: str = None,
                               limit: int = 50) -> List[Dict]:
         """
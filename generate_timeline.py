@@ -1,80 +1,169 @@
 """
-European Timeline Generator
+Historical Timeline Generator
 
 This script demonstrates how to use the encapsulated modules
-to generate European historical timeline data.
+to generate historical timeline data for one or more regions.
+
+Usage:
+    python generate_timeline.py --region European
+    python generate_timeline.py --region Chinese European
 """
 
-from timeline_generator import TimelineGenerator
+import os
+import argparse
+
+import dotenv
+
+
+# 各地区的抓取采样间隔与演示查询
+REGION_PRESETS = {
+    "European": {
+        "title": "欧洲历史大事年表生成器",
+        "sampling": {
+            "classical_years": 100,            # 古典时期：每100年
+            "medieval_years": 50,              # 中世纪：每50年
+            "early_modern_years": 25,          # 近代早期：每25年
+            "nineteenth_century_years": 10,    # 19世纪：每10年
+            "twentieth_century_years": 5,      # 20世纪：每5年
+            "twenty_first_century_years": 1,   # 21世纪：每年
+        },
+        "min_importance": 6,                   # 只保留重要事件
+        "timelines": [
+            # (标题, 起始年, 结束年, 最低重要性, 数量)
+            ("1900-2026年的历史事件", 1900, 2026, 7, 20),
+        ],
+        "searches": ["war"],
+        "cross_regional": (1945, ["Chinese"]),
+    },
+    "Chinese": {
+        "title": "中国历史大事年表生成器",
+        "sampling": {
+            "classical_years": 50,             # 古代时期（-1000 到 500）：每50年采样一次
+            "medieval_years": 25,              # 中世纪（500 到 1500）：每25年采样一次
+            "early_modern_years": 12,          # 近代早期（1500 到 1800）：每12年采样一次
+            "nineteenth_century_years": 10,    # 19世纪（1800 到 1900）：每10年采样一次
+            "twentieth_century_years": 5,      # 20世纪（1900 到 2000）：每5年采样一次
+            "twenty_first_century_years": 1,   # 21世纪（2000 到 2026）：每年采样一次
+        },
+        "min_importance": 5,                   # 最低重要性等级
+        "timelines": [
+            ("唐朝时期历史事件", 618, 907, 6, 20),
+            ("宋朝时期历史事件", 960, 1279, 6, 20),
+            ("明清时期历史事件", 1368, 1911, 7, 25),
+        ],
+        "searches": ["unification", "reform"],
+        "cross_regional": (756, ["European"]),  # 唐朝中期
+    },
+}
+
+SAMPLING_ARGS = list(REGION_PRESETS["European"]["sampling"])
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="生成历史大事年表")
+    parser.add_argument("--region", nargs="+", default=["European"],
+                        choices=sorted(REGION_PRESETS),
+                        help="要生成的地区，可指定多个以在同一进程中依次生成")
+    parser.add_argument("--model", default=None,
+                        help="LLM 模型名称（默认读取 OPENAI_MODEL）")
+    parser.add_argument("--min-importance", type=int, default=None,
+                        help="最低重要性等级（默认使用地区预设）")
+    parser.add_argument("--force-refresh", action="store_true",
+                        help="忽略缓存，重新抓取和处理")
+    for name in SAMPLING_ARGS:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=None,
+                            help="采样间隔（年，默认使用地区预设）")
+    return parser.parse_args(argv)
 
 
-def main():
-    """主函数：生成欧洲历史大事年表"""
+def print_events(events, limit: int, show_details: bool = False):
+    """打印事件列表的前几条"""
+    for event in events[:limit]:
+        line = f"  - {event['event_name']} ({event['start_year']})"
+        if show_details:
+            line += f" [{event.get('category', 'N/A')}] 重要性: {event['importance_level']}"
+        print(line)
+
+
+def generate_region(region: str, args: argparse.Namespace, model=None):
+    """为单个地区抓取数据并运行演示查询"""
+    # 延迟导入：--help 和参数错误时不必加载 LangChain / SQLAlchemy 等重型依赖
+    from timeline_generator import TimelineGenerator
+
+    preset = REGION_PRESETS[region]
 
     print("=" * 60)
-    print("欧洲历史大事年表生成器")
+    print(preset["title"])
     print("=" * 60)
 
-    # 初始化欧洲时间轴生成器
-    generator = TimelineGenerator(region="European")
+    generator = TimelineGenerator(region=region, llm_model=model)
 
-    # 生成真实历史数据
-    print("\n[生成] 从Wikipedia抓取欧洲历史数据...")
+    sampling = {
+        name: getattr(args, name) if getattr(args, name) is not None else default
+        for name, default in preset["sampling"].items()
+    }
+    min_importance = args.min_importance or preset["min_importance"]
+
+    print(f"\n[生成] 从Wikipedia抓取{region}历史数据...")
     result = generator.scrape_full_timeline(
-        classical_years=100,      # 古典时期：每100年
-        medieval_years=50,         # 中世纪：每50年
-        early_modern_years=25,     # 近代早期：每25年
-        nineteenth_century_years=10, # 19世纪：每10年
-        twentieth_century_years=5,    # 20世纪：每5年
-        twenty_first_century_years=1, # 21世纪：每年
-        min_importance=6,          # 只保留重要事件
+        **sampling,
+        min_importance=min_importance,
+        force_refresh=args.force_refresh,
         progress_callback=lambda x: print(f"  {x}")
     )
-    print(f"抓取结果: {result['events']} 个事件")
-
-    # 查询时间轴数据
-    print("\n[查询] 获取1900-2026年的历史事件...")
-    timeline = generator.get_timeline(
-        start_year=1900,
-        end_year=2026,
-        min_importance=7,  # 只显示重要事件
-        limit=20
+    print(f"生成结果: {result['events']} 个事件, {result['periods']} 个时期")
+
+    for label, start_year, end_year, importance, limit in preset["timelines"]:
+        print(f"\n[查询] 获取{label}...")
+        timeline = generator.get_timeline(
+            start_year=start_year,
+            end_year=end_year,
+            min_importance=importance,
+            limit=limit
+        )
+        print(f"找到 {len(timeline)} 个事件")
+        print_events(timeline, 5, show_details=True)
+
+    for keyword in preset["searches"]:
+        print(f"\n[搜索] 搜索包含 '{keyword}' 的事件...")
+        found = generator.search_events(keyword=keyword, limit=10)
+        print(f"找到 {len(found)} 个事件")
+        print_events(found, 3)
+
+    year, other_regions = preset["cross_regional"]
+    print(f"\n[跨地区] 查看{year}年的其他地区事件...")
+    cross_events = generator.get_cross_regional_view(
+        year=year,
+        other_regions=other_regions,
+        importance_threshold=7
     )
-    print(f"找到 {len(timeline)} 个事件")
-    for event in timeline[:5]:
-        print(f"  - {event['event_name']} ({event['start_year']}) "
-            f"[{event.get('category', 'N/A')}] 重要性: {event['importance_level']}")
-
-    # 关键词搜索
-    print("\n[搜索] 搜索包含 'war' 的事件...")
-    war_events = generator.search_events(keyword="war", limit=10)
-    print(f"找到 {len(war_events)} 个事件")
-    for event in war_events[:3]:
-        print(f"  - {event['event_name']} ({event['start_year']})")
-
-    # 获取统计数据
+    for other_region, events in cross_events.items():
+        print(f"  {other_region}: {len(events)} 个事件")
+        for event in events[:3]:
+            print(f"    - {event['event_name']} ({event['start_year']})")
+
     print("\n[统计] 数据库统计信息...")
     stats = generator.get_statistics()
     print(f"  总事件数: {stats.get('total_events', 0)}")
     print(f"  总时期数: {stats.get('total_periods', 0)}")
     if 'events_by_region' in stats:
         print(f"  按地区统计: {stats['events_by_region']}")
+    if 'periods_by_region' in stats:
+        print(f"  按地区统计时期: {stats['periods_by_region']}")
 
-    # 跨地区对比
-    print("\n[跨地区] 查看1945年的其他地区事件...")
-    cross_events = generator.get_cross_regional_view(
-        year=1945,
-        other_regions=["Chinese"],
-        importance_threshold=7
-    )
-    for region, events in cross_events.items():
-        print(f"  {region}: {len(events)} 个事件")
-        for event in events[:3]:
-            print(f"    - {event['event_name']} ({event['start_year']})")
+
+def run(args: argparse.Namespace):
+    """按参数依次生成各地区的大事年表"""
+    dotenv.load_dotenv(override=True)
+    model = args.model or os.getenv("OPENAI_MODEL")
+
+    for region in args.region:
+        generate_region(region, args, model=model)
 
     print("\n" + "=" * 60)
     print("生成完成！")
 
 
 if __name__ == "__main__":
-    main()
+    run(parse_args())
@@ -0,0 +1,29 @@
+"""
+Shared HTTP Connection Pool for LLM Clients
+
+This module provides a process-wide httpx client so every ChatOpenAI / OpenAI
+instance (processor, query engine, Batch API) reuses the same keep-alive
+connections instead of opening a new pool per instance.
+
+Only a sync client is shared: an httpx.AsyncClient's connections are bound
+to the event loop that first uses them, so an async client would have to be
+created per loop (nothing in the project calls the LLMs asynchronously).
+"""
+
+import atexit
+
+import httpx
+
+# Optional: HTTP/2 multiplexing needs the h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+SHARED_SYNC = httpx.Client(http2=HTTP2_ENABLED, limits=POOL_LIMITS)
+
+# Close the shared client at interpreter exit
+atexit.register(SHARED_SYNC.close)
@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+历史数据导入器：将 cache/ 下的历史 JSON 文件导入 periods / events 表
+
+各数据源的差异（时期类型规则、时期特征描述、是否导入事件）登记在 SOURCES 中，
+多个数据源在同一进程、同一连接内依次导入，大文件按 _COMMIT_EVERY_ROWS 分批提交。
+
+用法:
+    python importer.py                      # 依次导入全部数据源
+    python importer.py euro_history ch_history2
+"""
+
+import os
+import json
+import sqlite3
+import re
+import argparse
+
+try:
+    import orjson  # 可选依赖：解析速度比标准库 json 快 2-3 倍
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # 可选依赖：大文件按时期流式解析，不必一次读入整个 JSON
+except ImportError:
+    ijson = None
+
+# 超过该大小的 JSON 文件在安装了 ijson 时流式解析；小文件整体解析更快
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# 事件缓冲区攒到该条数时写入一次，流式导入时内存占用与文件大小无关
+_EVENT_BATCH_SIZE = 1000
+
+# 每写入这么多行提交一次并开始新事务，避免超大文件堆积成一个巨型事务；
+# 插入都是 INSERT OR IGNORE，中途失败后重新导入会跳过已提交的部分
+_COMMIT_EVERY_ROWS = 5000
+
+# 设置环境变量 IMPORT_VERBOSE=1 时逐条打印插入/跳过的时期，否则只打印汇总
+VERBOSE = bool(os.environ.get('IMPORT_VERBOSE'))
+
+# 批量导入时使用的 PRAGMA：WAL 模式下 synchronous=NORMAL 只在检查点时 fsync，
+# 导入每 _COMMIT_EVERY_ROWS 行提交一次（不超过该行数时只有一次提交）；
+# 断电最多丢失最后一批未提交的数据，不会损坏数据库
+_BULK_LOAD_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA locking_mode=EXCLUSIVE;
+"""
+
+# 时期以 (名称, 起始年份)、事件以 (名称, 起始年份, 地域) 建唯一索引，重复数据交给
+# INSERT OR IGNORE 跳过；不同地区的同名同年事件仍可并存
+_UNIQUE_INDEXES = (
+    ('ux_periods_name_start',
+     'CREATE UNIQUE INDEX IF NOT EXISTS ux_periods_name_start ON periods(period_name, start_year)'),
+    ('ux_events_name_start_region',
+     'CREATE UNIQUE INDEX IF NOT EXISTS ux_events_name_start_region ON events(event_name, start_year, region)'),
+)
+
+# 旧版本建立的事件索引不含地域，会拒绝其他地区的同名同年事件，导入前删除
+_SQL_DROP_LEGACY_INDEX = 'DROP INDEX IF EXISTS ux_events_name_start'
+
+# 时期以多行 VALUES 批量插入，RETURNING 返回实际插入（未被忽略）的行
+_SQL_INSERT_PERIODS = '''
+    INSERT OR IGNORE INTO periods (
+        period_name, start_year, end_year,
+        period_type, region, description,
+        era_characteristics, key_legacy
+    ) VALUES {values}
+    RETURNING period_name, start_year
+'''
+_PERIOD_COLUMNS = 8
+# 每条语句最多绑定 999 个参数（旧版 SQLite 的默认上限）
+_PERIOD_BATCH_SIZE = 999 // _PERIOD_COLUMNS
+
+_SQL_INSERT_EVENT = '''
+    INSERT OR IGNORE INTO events (
+        event_name, start_year, end_year, key_figures,
+        description, impact, category, region,
+        importance_level, source
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def parse_year_range(year_str):
+    """
+    解析年份范围字符串，返回 (start_year, end_year)
+    支持: "3000 BC - 1450", "-3000 to -1450", "753 BC - 509 BC", "330 AD - 1453 AD"
+    """
+    year_str = year_str.strip()
+
+    # 分隔符：" to "，否则取第一个不在开头的 "-"（开头的 "-" 是负号）
+    index = year_str.lower().find(' to ')
+    if index >= 0:
+        start_str, end_str = year_str[:index], year_str[index + 4:]
+    else:
+        index = year_str.find('-', 1)
+        if index < 0:
+            raise ValueError(f"无法解析年份范围: {year_str}")
+        start_str, end_str = year_str[:index], year_str[index + 1:]
+
+    start_year = parse_single_year(start_str)
+    end_year = parse_single_year(end_str)
+
+    return start_year, end_year
+
+def parse_single_year(year_str):
+    """
+    解析单个年份，支持 BC/AD
+    """
+    year_str = year_str.strip()
+    lowered = year_str.lower()
+
+    # 处理特殊情况
+    if lowered == 'present':
+        return 2026  # 使用当前年份
+
+    # 快速路径："1453"、"-3000"、"500 BC"、"330 AD"
+    number, _, _ = lowered.partition(' ')
+    if number.lstrip('-').isdecimal():
+        year_num = int(number)
+    else:
+        # 其他格式（如 "c.500"）取第一段连续数字
+        digits = ''
+        for ch in year_str:
+            if ch.isdecimal():
+                digits += ch
+            elif digits:
+                break
+        if not digits:
+            raise ValueError(f"无法从 '{year_str}' 提取年份")
+        year_num = int(digits)
+
+    # 处理 BC（公元前）- 转换为负数
+    if 'bc' in lowered:
+        return -abs(year_num)
+
+    # AD 或其他情况保持原值
+    return year_num
+
+def _keywords(*keyword_lists):
+    """
+    把若干关键词列表合并编译为一个纯文本交替式
+
+    关键词预先转小写并转义，只用于搜索已转小写的文本；一次 search 即可判断
+    是否命中任意关键词，不必逐个关键词做子串查找
+    """
+    keywords = [keyword.lower() for keywords in keyword_lists for keyword in keywords]
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# 时期类型规则：按顺序排列的 (period_type, 关键词匹配器)，在中英文名中搜索，
+# 第一个命中的规则决定类型；都未命中的一律视为连续时期。
+# 相邻且结果相同的关键词组合并成一个匹配器。
+EURO_HISTORY_RULES = (
+    ('independent', _keywords(
+        # 特殊处理
+        ['Black Death', '黑死病'],
+        [
+            # 特定事件/运动/战争类
+            'Crusade',  # 十字军东征
+            'War',  # 战争
+            'Battle',  # 战役
+            'Revolution',  # 革命（特定事件）
+            'Movement',  # 运动
+            'Enlightenment',  # 启蒙运动
+
+            # 中文特定事件
+            '战争',  # 战争
+            '东征',  # 东征
+            '革命',  # 革命
+            '运动',  # 运动
+            '黑死病',  # 黑死病
+        ],
+    )),
+)
+
+EURO_HISTORY2_RULES = (
+    # 明确是 independent 的时期
+    ('independent', _keywords([
+        'Black Death', '黑死病',
+        'Reformation', '宗教改革',
+        'Scientific Revolution', '科学革命',
+        'Enlightenment', '启蒙运动',
+    ])),
+    # 世界大战虽然是事件，但通常被视为一个时期
+    ('continuous', _keywords(['World War', '世界大战'])),
+    ('independent', _keywords([
+        # 特定事件/运动/战争类
+        'Crusade',  # 十字军东征
+        'War',  # 战争 (World War 除外)
+        'Battle',  # 战役
+        'Revolution',  # 革命（特定事件）
+        'Movement',  # 运动
+        'Enlightenment',  # 启蒙运动
+        'Reformation',  # 宗教改革
+        'Scientific Revolution',  # 科学革命
+
+        # 中文特定事件
+        '战争',  # 战争
+        '东征',  # 东征
+        '革命',  # 革命
+        '运动',  # 运动
+        '黑死病',  # 黑死病
+        '宗教改革',  # 宗教改革
+        '科学革命',  # 科学革命
+    ])),
+)
+
+EURO_HISTORY3_RULES = (
+    ('independent', _keywords(
+        # 特殊独立事件
+        [
+            'Black Death',  # 黑死病
+            'Reformation', # 宗教改革
+            'Proclamation', # 宣言、宣告
+            'Reform',  # 改革
+            'Scientific Revolution',  # 科学革命
+            'Olympic Games',  # 奥林匹克运动会
+            'Marathon Battle',  # 马拉松战役
+            'Parthenon Construction',  # 帕特农神庙建成
+            'Socrates Death',  # 苏格拉底之死
+            'Crossing Rubicon',  # 跨越卢比孔河
+            'Rome Founding',  # 罗马建城
+        ],
+        # 独立事件模式
+        [
+            'Crusade',  # 十字军东征
+            'War',  # 战争
+            'Battle',  # 战役
+            'Revolution',  # 革命
+            'Movement', # 运动
+            'Enlightenment',  # 启蒙运动
+            'Reformation',  # 宗教改革
+            'Treaty', # 条约
+        ],
+    )),
+)
+
+EURO_HISTORY4_RULES = (
+    ('independent', _keywords(
+        # 特殊独立事件
+        [
+            'exodus',  # 出埃及
+            'crucifixion',  # 钉十字架
+            'resurrection',  # 复活
+            'conversion',  # 改信
+            'schism',  # 分裂
+            'reformation',  # 改革
+            'holocaust',  # 大屠杀
+            'council',  # 会议
+        ],
+        # 独立事件（特定时间点的事件）
+        [
+            'war',  # 战争
+            'battle',  # 战役
+            'revolution',  # 革命
+            'rebellion',  # 叛乱
+            'uprising',  # 起义
+            'council',  # 会议
+        ],
+    )),
+)
+
+CH_HISTORY2_RULES = (
+    ('independent', _keywords(
+        ['founding', 'translation', 'reform', 'movement', 'uprising', 'persecution'],
+        ['war', 'battle', 'rebellion', 'revolution', 'uprising', 'founding', 'persecution', 'suppression'],
+    )),
+)
+
+# 中国宗教史各时期的时期特征和历史影响：时期名（与 JSON 中的键一致）-> (era_characteristics, key_legacy)
+CH_HISTORY2_DESCRIPTORS = {
+    "Foundations of Taoism": (
+        "道家哲学体系建立；清静无为思想形成；宇宙本源理论创立；道德伦理观念体系化",
+        "奠定了中国本土哲学基础；影响了后世政治治理理念；塑造了中华文明的宇宙观",
+    ),
+    "The Arrival and Early Translation of Buddhism": (
+        "佛教传入与经典翻译；僧伽制度建立；寺院经济发展；中印文化交流活跃",
+        "开启了佛教中国化进程；促进了中印文化交流；奠定了中国佛教发展基础",
+    ),
+    "The Golden Age of Religion and Integration": (
+        "宗教鼎盛时期；三教合一思潮兴起；各宗派相互融合；宗教与皇权深度结合",
+        "形成了独特的中国宗教格局；三教合一思想影响深远；宗教促进文化大发展",
+    ),
+    "The Later Developments and Syncretism": (
+        "宗教民间化发展；三教融合深化；神秘主义兴起；宗教与伦理紧密结合",
+        "标志着宗教进入民间化阶段；儒释道三家思想深入融合；影响了民众日常生活",
+    ),
+}
+CH_HISTORY2_DEFAULT_DESCRIPTOR = ("宗教发展与变革", "对后世产生宗教影响")
+
+# 欧洲宗教史各时期的时期特征和历史影响
+EURO_HISTORY4_DESCRIPTORS = {
+    "Foundations of Abrahamic Faiths": (
+        "一神教信仰体系形成；圣经文献编纂；先知传统建立；律法传统起源；道德观念体系化",
+        "奠定了西方一神教基础；影响了犹太教、基督教、伊斯兰教发展；塑造了西方道德哲学传统",
+    ),
+    "The Rise of Universal Church": (
+        "基督教体制化发展；教义统一化；教会与皇权结合；传教网络扩展；宗教权威集中化",
+        "建立了基督教正统教义体系；形成了教会组织模式；影响了中世纪欧洲政治格局",
+    ),
+    "Great Schisms and Crusades": (
+        "基督教大分裂；宗教战争爆发；东西方教会对立；十字军东征运动；宗教军事化冲突",
+        "导致基督教东西分裂；促进了东西方文化交流；塑造了宗教与政治的关系模式",
+    ),
+    "Reformation and Denominational Pluralism": (
+        "宗教改革兴起；新教诞生；宗教多样性增加；印刷术助力；民族宗教形成",
+        "打破了天主教会垄断；推动了宗教自由发展；促进了民族国家意识觉醒",
+    ),
+}
+EURO_HISTORY4_DEFAULT_DESCRIPTOR = ("宗教发展与变革", "对后世产生宗教影响")
+
+# 数据源登记表：名称 -> import_source 的参数
+SOURCES = {
+    'euro_history': {
+        'json_path': 'cache/European/euro_history.json',
+        'region': 'European',
+        'rules': EURO_HISTORY_RULES,
+        'description_from': 'period_name_cn',  # 使用中文时期名作为描述
+    },
+    'euro_history2': {
+        'json_path': 'cache/European/euro_history2.json',
+        'region': 'European',
+        'rules': EURO_HISTORY2_RULES,
+        'description_from': 'period_name_cn',
+    },
+    'euro_history3': {
+        'json_path': 'cache/European/euro_history3.json',
+        'region': 'European',
+        'rules': EURO_HISTORY3_RULES,
+        'with_events': False,              # 只导入时期
+    },
+    'euro_history4': {
+        'json_path': 'cache/European/euro_history4.json',
+        'region': 'European',
+        'rules': EURO_HISTORY4_RULES,
+        'descriptors': EURO_HISTORY4_DESCRIPTORS,
+        'default_descriptor': EURO_HISTORY4_DEFAULT_DESCRIPTOR,
+        'description_from': 'era_characteristics',  # 使用时期特征作为描述
+    },
+    'ch_history2': {
+        'json_path': 'cache/Chinese/ch_history2.json',
+        'region': 'Chinese',
+        'rules': CH_HISTORY2_RULES,
+        'descriptors': CH_HISTORY2_DESCRIPTORS,
+        'default_descriptor': CH_HISTORY2_DEFAULT_DESCRIPTOR,
+    },
+}
+
+def determine_period_type(period_name, period_name_cn, rules):
+    """
+    根据数据源的规则推断 period_type
+    """
+    # 中英文名拼成一个字符串只搜索一次；关键词都不含换行，不会跨两个名字误匹配
+    haystack = (period_name + '\n' + period_name_cn).lower()
+
+    for period_type, matcher in rules:
+        if matcher.search(haystack):
+            return period_type
+
+    # 默认为连续时期
+    return 'continuous'
+
+def load_json(json_path):
+    """读取 JSON 文件，优先使用 orjson"""
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def iter_periods(json_path):
+    """
+    逐个产出 (period_name, period_data)
+
+    大文件且安装了 ijson 时边读边解析，否则整体读入后遍历
+    """
+    if ijson and os.path.getsize(json_path) >= _STREAM_MIN_BYTES:
+        with open(json_path, 'rb') as f:
+            # use_float=True：小数解析为 float 而不是 sqlite3 无法绑定的 Decimal
+            yield from ijson.kvitems(f, '', use_float=True)
+    else:
+        yield from load_json(json_path).items()
+
+def _event_row(event, start_year, region):
+    """把事件字典转换为 _SQL_INSERT_EVENT 的参数元组，缺省值取所属时期"""
+    event_start_year = event.get('start_year', start_year)
+    return (
+        event.get('event_name', ''),
+        event_start_year,
+        event.get('end_year') or event_start_year,  # 如果 end_year 为空，使用 start_year
+        event.get('key_figures', ''),
+        event.get('description', ''),
+        event.get('impact', ''),
+        event.get('category', ''),
+        event.get('region', region),
+        event.get('importance_level', 5),
+        event.get('source', '')
+    )
+
+def import_periods(conn, periods, region, rules, descriptors=None,
+                   default_descriptor=(None, None), description_from=None,
+                   with_events=True):
+    """
+    一次遍历插入时期及其事件，periods 为 (period_name, period_data) 的可迭代对象
+
+    时期攒满 _PERIOD_BATCH_SIZE 条用一条多行 INSERT 写入；事件转换为参数元组
+    放入缓冲区，攒满 _EVENT_BATCH_SIZE 条由 executemany 写入一次。
+    已存在的时期和事件由唯一索引忽略。处于事务中时每写入 _COMMIT_EVERY_ROWS 行
+    提交一次并重新 BEGIN IMMEDIATE。
+    返回 dict: periods_inserted / periods_duplicates / events_total / events_inserted
+    """
+    cursor = conn.cursor()
+    descriptors = descriptors or {}
+    stats = dict.fromkeys(('periods_inserted', 'periods_duplicates',
+                           'events_total', 'events_inserted'), 0)
+    pending_periods = []
+    pending_events = []
+    rows_since_commit = 0
+
+    def written(rows):
+        nonlocal rows_since_commit
+        rows_since_commit += rows
+        if rows_since_commit >= _COMMIT_EVERY_ROWS and conn.in_transaction:
+            conn.execute('COMMIT')
+            conn.execute('BEGIN IMMEDIATE')
+            rows_since_commit = 0
+
+    def flush_periods():
+        values = ', '.join(['(' + ', '.join('?' * _PERIOD_COLUMNS) + ')'] * len(pending_periods))
+        params = [value for row, _ in pending_periods for value in row]
+        inserted = set(cursor.execute(_SQL_INSERT_PERIODS.format(values=values), params).fetchall())
+        stats['periods_inserted'] += len(inserted)
+        stats['periods_duplicates'] += len(pending_periods) - len(inserted)
+
+        if VERBOSE:
+            for row, period_name_cn in pending_periods:
+                period_name, start_year, end_year, period_type = row[:4]
+                if (period_name, start_year) in inserted:
+                    # 同一批次内重复的时期只有第一条算作插入
+                    inserted.discard((period_name, start_year))
+                    print(f"✅ 插入时期: {period_name_cn} ({start_year} - {end_year}) [{period_type}]")
+                else:
+                    print(f"⏭️  时期已存在: {period_name} ({start_year} - {end_year})")
+        written(len(pending_periods))
+        pending_periods.clear()
+
+    def flush_events():
+        cursor.executemany(_SQL_INSERT_EVENT, pending_events)
+        stats['events_total'] += len(pending_events)
+        stats['events_inserted'] += cursor.rowcount
+        written(len(pending_events))
+        pending_events.clear()
+
+    for period_name, period_data in periods:
+        year_str = period_data.get('year', '')
+        if not year_str:
+            print(f"⚠️ 跳过没有年份信息的时期: {period_name}")
+            continue
+        try:
+            start_year, end_year = parse_year_range(year_str)
+        except ValueError as e:
+            print(f"⚠️ 跳过无法解析年份的时期: {period_name} ({year_str}) - {e}")
+            continue
+
+        period_name_cn = period_data.get('period_name_cn', period_name)
+        period_region = period_data.get('region', region)
+        period_type = determine_period_type(period_name, period_name_cn, rules)
+
+        era_characteristics, key_legacy = descriptors.get(period_name, default_descriptor)
+
+        if description_from == 'period_name_cn':
+            description = period_name_cn
+        elif description_from == 'era_characteristics':
+            description = era_characteristics
+        else:
+            description = period_data.get('description', '')
+
+        pending_periods.append(((
+            period_name,         # period_name
+            start_year,          # start_year
+            end_year,            # end_year
+            period_type,         # period_type
+            period_region,       # region
+            description,         # description
+            era_characteristics, # era_characteristics
+            key_legacy           # key_legacy
+        ), period_name_cn))
+        if len(pending_periods) >= _PERIOD_BATCH_SIZE:
+            flush_periods()
+
+        if with_events:
+            pending_events.extend(
+                _event_row(event, start_year, period_region)
+                for event in period_data.get('events', [])
+            )
+            if len(pending_events) >= _EVENT_BATCH_SIZE:
+                flush_events()
+
+    if pending_periods:
+        flush_periods()
+    if pending_events:
+        flush_events()
+
+    return stats
+
+def import_source(conn, json_path, region, rules, descriptors=None,
+                  default_descriptor=(None, None), description_from=None,
+                  with_events=True):
+    """
+    导入单个 JSON 数据源，调用方负责提交事务
+    """
+    print(f"📂 加载 {json_path}...")
+    if not os.path.exists(json_path):
+        print(f"❌ 文件未找到: {json_path}")
+        return
+
+    total_periods = 0
+
+    def counted_periods():
+        nonlocal total_periods
+        for item in iter_periods(json_path):
+            total_periods += 1
+            yield item
+
+    stats = import_periods(
+        conn, counted_periods(), region, rules,
+        descriptors=descriptors,
+        default_descriptor=default_descriptor,
+        description_from=description_from,
+        with_events=with_events,
+    )
+    print(f"📊 共找到 {total_periods} 个历史时期")
+    print(f"✅ 新增时期: {stats['periods_inserted']} 个")
+    print(f"⏭️ 重复时期: {stats['periods_duplicates']} 个")
+
+    if with_events:
+        print(f"✅ 新增事件: {stats['events_inserted']} 个")
+        print(f"⏭️ 重复事件: {stats['events_total'] - stats['events_inserted']} 个")
+
+def print_stats(conn):
+    """显示数据库统计（periods、events 各一次分组查询）"""
+    period_by_region = {}
+    period_by_type = {}
+    for region, period_type, count in conn.execute(
+            'SELECT region, period_type, COUNT(*) FROM periods GROUP BY region, period_type'):
+        period_by_region[region] = period_by_region.get(region, 0) + count
+        period_by_type[period_type] = period_by_type.get(period_type, 0) + count
+
+    event_by_region = {}
+    religious_events = 0
+    for region, is_religious, count in conn.execute(
+            "SELECT region, category = '宗教', COUNT(*) FROM events GROUP BY region, category = '宗教'"):
+        event_by_region[region] = event_by_region.get(region, 0) + count
+        if is_religious:
+            religious_events += count
+
+    print(f"🇪🇺 欧洲时期总数: {period_by_region.get('European', 0)}")
+    print(f"🇨🇳 中国时期总数: {period_by_region.get('Chinese', 0)}")
+    print(f"📈 连续时期数: {period_by_type.get('continuous', 0)}")
+    print(f"🎯 独立事件数: {period_by_type.get('independent', 0)}")
+    print(f"🇪🇺 欧洲事件总数: {event_by_region.get('European', 0)}")
+    print(f"🇨🇳 中国事件总数: {event_by_region.get('Chinese', 0)}")
+    print(f"⛪ 宗教相关事件总数: {religious_events}")
+
+def run(names, db_path='data.db'):
+    """
+    在同一连接内依次导入指定的数据源
+    """
+    # 关闭 sqlite3 模块的隐式事务管理，由 BEGIN IMMEDIATE / COMMIT 显式控制事务；
+    # 数据量不超过 _COMMIT_EVERY_ROWS 行时整个导入只有一次提交
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.executescript(_BULK_LOAD_PRAGMAS)
+    conn.execute(_SQL_DROP_LEGACY_INDEX)
+    for index_name, index_sql in _UNIQUE_INDEXES:
+        try:
+            conn.execute(index_sql)
+        except sqlite3.IntegrityError:
+            print(f"⚠️ 表中已有重复数据，未创建唯一索引 {index_name}，本次导入不会跳过重复行")
+
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        for name in names:
+            print("\n" + "="*60)
+            print(f"📝 导入数据源: {name}")
+            print("="*60)
+            import_source(conn, **SOURCES[name])
+    except BaseException:
+        conn.execute('ROLLBACK')
+        conn.close()
+        raise
+    conn.execute('COMMIT')
+
+    print("\n🎉 数据导入完成！")
+
+    print("\n📊 数据库统计：")
+    print_stats(conn)
+
+    conn.close()
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="导入历史 JSON 数据到 data.db")
+    parser.add_argument("sources", nargs="*", metavar="SOURCE",
+                        help=f"要导入的数据源（默认全部）: {', '.join(SOURCES)}")
+    parser.add_argument("--db", default="data.db", help="数据库路径")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.sources if name not in SOURCES]
+    if unknown:
+        parser.error(f"未知的数据源: {', '.join(unknown)}")
+    args.sources = args.sources or list(SOURCES)
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.sources, db_path=args.db)
@@ -4,28 +4,55 @@
 按照与欧洲史相同的处理方式
 """
 
+import os
 import json
 import sqlite3
-import re
+
+try:
+    import orjson  # 可选依赖：解析速度比标准库 json 快 2-3 倍
+except ImportError:
+    orjson = None
+
+# 设置环境变量 IMPORT_VERBOSE=1 时逐个时期打印导入结果，否则只打印汇总
+VERBOSE = bool(os.environ.get('IMPORT_VERBOSE'))
+
+# 热路径 SQL 语句，保持文本不变以命中 sqlite3 的语句缓存
+# 依赖 (period_name, start_year) 唯一索引：已存在的时期不插入也不返回行，一条语句完成查重和插入
+_SQL_INSERT_PERIOD = '''
+    INSERT INTO periods (
+        period_name, start_year, end_year,
+        period_type, region, description,
+        era_characteristics, key_legacy
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(period_name, start_year) DO NOTHING
+    RETURNING id
+'''
+
+_SQL_SELECT_EVENT_KEYS = 'SELECT event_name, start_year FROM events'
+
+_SQL_INSERT_EVENT = '''
+    INSERT INTO events (
+        event_name, start_year, end_year, key_figures,
+        description, impact, category, region,
+        importance_level, source
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
 
 def parse_year_range(year_str):
     """解析年份范围字符串"""
     year_str = year_str.strip()
     
     # 处理 "c. 2070 BC - 1600 BC" 格式
-    year_str = re.sub(r'^c\.\s*', '', year_str)  # 移除开头的 "c. "
+    if year_str.startswith('c.'):
+        year_str = year_str[2:]  # 移除开头的 "c."
     
-    if 'to' in year_str.lower():
-        parts = year_str.split('to')
-    else:
-        parts = year_str.split('-')
+    separator = 'to' if 'to' in year_str else '-'
+    start_str, found, _ = year_str.partition(separator)
+    end_str = year_str.rpartition(separator)[2]
     
-    if len(parts) < 2:
+    if not found:
         raise ValueError(f"无法解析年份范围: {year_str}")
     
-    start_str = parts[0].strip()
-    end_str = parts[-1].strip()
-    
     start_year = parse_single_year(start_str)
     end_year = parse_single_year(end_str)
     
@@ -36,21 +63,29 @@ def parse_single_year(year_str):
     year_str = year_str.strip()
     
     # 处理 "c." 前缀
-    year_str = re.sub(r'^c\.\s*', '', year_str)
+    if year_str.startswith('c.'):
+        year_str = year_str[2:].lstrip()
+    
+    lowered = year_str.lower()
     
     # 处理特殊情况
-    if year_str.lower() == 'present':
+    if lowered == 'present':
         return 2026
     
-    # 提取数字部分
-    num_match = re.search(r'(\d+)', year_str)
-    if not num_match:
+    # 提取第一段连续数字
+    digits = ''
+    for ch in year_str:
+        if ch.isdecimal():
+            digits += ch
+        elif digits:
+            break
+    if not digits:
         raise ValueError(f"无法从 '{year_str}' 提取年份")
     
-    year_num = int(num_match.group(1))
+    year_num = int(digits)
     
     # 处理 BC（公元前）- 转换为负数
-    if 'bc' in year_str.lower():
+    if 'bc' in lowered:
         return -year_num
     
     # AD 或其他情况保持为正数
@@ -62,20 +97,20 @@ def determine_period_type(period_name, period_name_cn, start_year):
     """
     # 连续时期（朝代、帝国等）
     continuous_patterns = [
-        r'dynasty',  # 朝代
-        r'empire',  # 帝国
-        r'kingdom',  # 王国
-        r'republic',  # 共和国
-        r'period',  # 时期
+        'dynasty',  # 朝代
+        'empire',  # 帝国
+        'kingdom',  # 王国
+        'republic',  # 共和国
+        'period',  # 时期
     ]
     
     # 独立事件（特定时间点的事件）
     independent_patterns = [
-        r'war',  # 战争
-        r'battle',  # 战役
-        r'revolution',  # 革命
-        r'rebellion',  # 叛乱
-        r'uprising',  # 起义
+        'war',  # 战争
+        'battle',  # 战役
+        'revolution',  # 革命
+        'rebellion',  # 叛乱
+        'uprising',  # 起义
     ]
     
     # 特殊独立事件
@@ -85,19 +120,22 @@ def determine_period_type(period_name, period_name_cn, start_year):
         'movement',  # 运动
     ]
     
+    # 中英文名拼成一个字符串只搜索一次；关键词都不含换行，不会跨两个名字误匹配
+    haystack = (period_name + '\n' + period_name_cn).lower()
+    
     # 检查特殊词汇
     for keyword in special_independent:
-        if keyword.lower() in period_name.lower() or keyword.lower() in period_name_cn.lower():
+        if keyword in haystack:
             return 'independent'
     
     # 检查独立事件模式
     for pattern in independent_patterns:
-        if re.search(pattern, period_name, re.IGNORECASE) or re.search(pattern, period_name_cn, re.IGNORECASE):
+        if pattern in haystack:
             return 'independent'
     
     # 检查连续时期模式
     for pattern in continuous_patterns:
-        if re.search(pattern, period_name, re.IGNORECASE) or re.search(pattern, period_name_cn, re.IGNORECASE):
+        if pattern in haystack:
             return 'continuous'
     
     # 根据时间长度判断 - 超过50年的通常是连续时期
@@ -117,8 +155,9 @@ def main():
     
     file_path = 'cache/Chinese/ch_history.json'
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            periods_data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        periods_data = orjson.loads(raw) if orjson else json.loads(raw)
     except FileNotFoundError:
         print(f"❌ 文件未找到: {file_path}")
         return
@@ -126,8 +165,16 @@ def main():
     print(f"📊 共找到 {len(periods_data)} 个历史时期")
 
     # 连接数据库
-    conn = sqlite3.connect('data.db')
+    # 关闭 sqlite3 模块的隐式事务管理，整个导入只有一次 BEGIN IMMEDIATE / COMMIT
+    conn = sqlite3.connect('data.db', cached_statements=256, isolation_level=None)
     cursor = conn.cursor()
+    conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_periods_name_start ON periods(period_name, start_year)')
+
+    conn.execute('BEGIN IMMEDIATE')
+
+    # 一次性取出已有事件的 (名称, 起始年份)，查重改为集合判断，不再逐条 SELECT
+    existing_events = set(cursor.execute(_SQL_SELECT_EVENT_KEYS))
+    new_events = []
 
     periods_inserted = 0
     events_inserted = 0
@@ -155,52 +202,26 @@ def main():
         # 确定时期类型
         period_type = determine_period_type(period_name, period_name_cn, start_year)
         
-        # 检查时期是否已存在
-        cursor.execute('''
-            SELECT id FROM periods
-            WHERE period_name = ? AND start_year = ?
-        ''', (period_name, start_year))
+        # 插入新时期到 periods 表（已存在则跳过）
+        cursor.execute(_SQL_INSERT_PERIOD, (
+            period_name,         # period_name
+            start_year,          # start_year
+            end_year,            # end_year
+            period_type,         # period_type
+            region,              # region
+            era_characteristics, # description (使用时期特征)
+            era_characteristics, # era_characteristics
+            key_legacy           # key_legacy
+        ))
         
-        if not cursor.fetchone():
-            # 插入新时期到 periods 表
-            print(f"✅ 插入时期: {period_name} ({start_year}-{end_year}) [{period_type}]")
-            
-            cursor.execute('''
-                INSERT INTO periods (
-                    period_name, start_year, end_year, 
-                    period_type, region, description,
-                    era_characteristics, key_legacy
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                period_name,         # period_name
-                start_year,          # start_year
-                end_year,            # end_year
-                period_type,         # period_type
-                region,              # region
-                era_characteristics, # description (使用时期特征)
-                era_characteristics, # era_characteristics
-                key_legacy           # key_legacy
-            ))
-            
+        if cursor.fetchone():
             periods_inserted += 1
         else:
-            print(f"⏭️ 时期已存在: {period_name} ({start_year})")
             periods_duplicates += 1
         
-        # 获取时期ID（用于插入事件）
-        cursor.execute('''
-            SELECT id FROM periods
-            WHERE period_name = ? AND start_year = ?
-        ''', (period_name, start_year))
-        period_result = cursor.fetchone()
-        if period_result:
-            period_id = period_result[0]
-        else:
-            print(f"❌ 无法获取时期ID: {period_name}")
-            continue
-        
         # 插入事件
         events = period_data.get('events', [])
+        period_events_inserted = 0
         for event in events:
             event_name = event.get('event_name', '')
             event_start_year = event.get('start_year', start_year)
@@ -214,21 +235,11 @@ def main():
             source = event.get('source', '')
             
             # 检查事件是否已存在
-            cursor.execute('''
-                SELECT id FROM events
-                WHERE event_name = ? AND start_year = ?
-            ''', (event_name, event_start_year))
+            event_key = (event_name, event_start_year)
             
-            if not cursor.fetchone():
-                print(f"  ✅ 插入事件: {event_name} ({event_start_year})")
-                
-                cursor.execute('''
-                    INSERT INTO events (
-                        event_name, start_year, end_year, key_figures,
-                        description, impact, category, region, 
-                        importance_level, source
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            if event_key not in existing_events:
+                existing_events.add(event_key)
+                new_events.append((
                     event_name,         # event_name
                     event_start_year,   # start_year
                     event_end_year,     # end_year
@@ -242,12 +253,16 @@ def main():
                 ))
                 
                 events_inserted += 1
+                period_events_inserted += 1
             else:
-                print(f"  ⏭️ 事件已存在: {event_name} ({event_start_year})")
                 events_duplicates += 1
 
-    conn.commit()
-    conn.close()
+        if VERBOSE:
+            print(f"✅ {period_name} ({start_year}-{end_year}) [{period_type}]: "
+                  f"新增事件 {period_events_inserted}/{len(events)} 个")
+
+    cursor.executemany(_SQL_INSERT_EVENT, new_events)
+    conn.execute('COMMIT')
 
     print("\n🎉 数据导入完成！")
     print(f"✅ 新增时期: {periods_inserted} 个")
@@ -255,27 +270,18 @@ def main():
     print(f"⏭️ 重复时期: {periods_duplicates} 个")
     print(f"⏭️ 重复事件: {events_duplicates} 个")
     
-    # 显示数据库统计
+    # 显示数据库统计（复用导入时的连接）
     print("\n📊 数据库统计：")
-    conn = sqlite3.connect('data.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT COUNT(*) FROM periods WHERE region = "Chinese";')
-    total_chinese = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM periods WHERE region = "European";')
-    total_european = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM events WHERE region = "Chinese";')
-    total_chinese_events = cursor.fetchone()[0]
+    cursor.execute('SELECT region, COUNT(*) FROM periods GROUP BY region')
+    period_counts = dict(cursor.fetchall())
     
-    cursor.execute('SELECT COUNT(*) FROM events WHERE region = "European";')
-    total_european_events = cursor.fetchone()[0]
+    cursor.execute('SELECT region, COUNT(*) FROM events GROUP BY region')
+    event_counts = dict(cursor.fetchall())
     
-    print(f"🇨🇳 中国时期总数: {total_chinese}")
-    print(f"🇪🇺 欧洲时期总数: {total_european}")
-    print(f"🇨🇳 中国事件总数: {total_chinese_events}")
-    print(f"🇪🇺 欧洲事件总数: {total_european_events}")
+    print(f"🇨🇳 中国时期总数: {period_counts.get('Chinese', 0)}")
+    print(f"🇪🇺 欧洲时期总数: {period_counts.get('European', 0)}")
+    print(f"🇨🇳 中国事件总数: {event_counts.get('Chinese', 0)}")
+    print(f"🇪🇺 欧洲事件总数: {event_counts.get('European', 0)}")
     
     conn.close()
 
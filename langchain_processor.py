@@ -6,8 +6,11 @@ from Wikipedia into the database schema format.
 """
 
 import os
+import re
 import json
-from typing import List, Dict, Optional, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple, Callable
 from dotenv import load_dotenv
 
 # Try imports from the latest LangChain packages first (recommended as of 2025)
@@ -25,30 +28,140 @@ except ImportError:
         )
 
 # Import ChatPromptTemplate
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
 
-# Import Pydantic components
+# Import Pydantic components (v2: validation runs in pydantic-core)
 try:
-    from pydantic import BaseModel, Field
+    from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 except ImportError:
     raise ImportError(
-        "Pydantic is required. Please install: pip install pydantic"
+        "Pydantic v2 is required. Please install: pip install 'pydantic>=2'"
     )
 
 # Import PydanticOutputParser
 from langchain_core.output_parsers import PydanticOutputParser
 
+# Optional: OpenAI SDK for the Batch API (installed alongside langchain-openai)
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
+from cache_manager import ContentCache
+from http_pool import SHARED_SYNC
+from rate_limiter import TokenBucket, estimate_tokens, truncate_tokens
+
+# Maximum number of LLM requests in flight for the *_batch extractors
+DEFAULT_CONCURRENCY = 10
+
+# Input token budget for the page extract in each prompt type
+TOKEN_BUDGETS = {"page": 1800, "year": 2200, "dynasty": 4500}
+
+# Output token cap per prompt type; dynasty arrays scale with max_events
+COMPLETION_LIMITS = {"page": 512, "year": 2048}
+COMPLETION_TOKENS_PER_EVENT = 300
+
+# Paragraphs mentioning these (and paragraphs under these section headings)
+# are kept first when an extract is over its token budget
+RELEVANT_KEYWORDS = ("event", "war", "dynasty", "emperor", "treaty", "战", "朝", "帝")
+PREFERRED_SECTIONS = ("history", "events", "timeline", "历史", "大事", "事件")
+
+# LangChain message types to OpenAI chat roles (Batch API request bodies)
+_OPENAI_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+# First ```json / ```python / ``` fenced block in an LLM response
+_FENCE_RE = re.compile(r"```(?:json|python)?\s*(.*?)\s*```", re.DOTALL)
+
+# Completion tokens reserved per request by the rate limiter before usage is known
+ESTIMATED_COMPLETION_TOKENS = 1024
+
+# Model used when neither the model argument nor OPENAI_MODEL is set
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# Requests-per-minute ceiling used when only a token limit (OPENAI_TPM) is set
+DEFAULT_RPM = 10000
+
+# Seconds between status polls while waiting for an OpenAI Batch API job
+BATCH_POLL_INTERVAL = 60
+
+
+# Prompt templates, parsed once per HistoricalDataProcessor. Each prompt is a
+# static system message (instructions + format instructions, byte-identical
+# on every call so providers can cache the prefix) followed by a user message
+# carrying only the per-page values.
+EVENT_PAGE_SYSTEM_TEMPLATE = """你是一位历史学家，正在分析历史事件。从用户提供的维基百科页面内容中提取结构化信息。
+
+提取以下信息（所有文本字段必须输出为中文）：
+{format_instructions}
+
+只返回 JSON 对象，不要其他文字。
+"""
+
+PERIOD_PAGE_SYSTEM_TEMPLATE = """你是一位历史学家，正在分析历史时期。从用户提供的维基百科页面内容中提取结构化信息。
+
+提取以下信息（所有文本字段必须输出为中文）：
+{format_instructions}
+
+只返回 JSON 对象，不要其他文字。
+"""
+
+PAGE_HUMAN_TEMPLATE = """标题：{title}
+内容：{content}
+地区：{region}
+"""
+
+YEAR_PAGE_SYSTEM_TEMPLATE = """为用户指定的年份和地区生成该年度可能发生的重大历史事件。如果页面内容中有相关信息，请结合使用；如果页面内容不足或没有相关信息，请主要基于历史知识生成合理的事件。
+
+提取该年度发生的重要事件。为每个事件提供以下信息（所有文本字段必须输出为中文）：
+{format_instructions}
+
+返回 JSON 数组格式的事件对象，不要其他文字。
+"""
+
+YEAR_PAGE_HUMAN_TEMPLATE = """年份：{year}
+内容：{content}
+地区：{region}
+"""
+
+DYNASTY_PAGE_SYSTEM_TEMPLATE = """从用户提供的朝代页面内容中提取该朝代期间发生的重大历史事件。为每个事件提供以下信息（所有文本字段必须输出为中文）：
+{format_instructions}
+
+请按时间顺序排列事件，并确保涵盖不同类别（政治、军事、文化、经济等）。
+
+返回 JSON 数组格式的事件对象，不要其他文字。
+"""
+
+DYNASTY_PAGE_HUMAN_TEMPLATE = """朝代：{dynasty}
+内容：{content}
+地区：{region}
+
+最多提取 {max_events} 个事件。
+"""
+
 
 class EventSchema(BaseModel):
     """Pydantic model for historical events."""
-    event_name: str = Field(description="历史事件的名称（中文）")
+    event_name: str = Field(min_length=1, description="历史事件的名称（中文）")
     start_year: int = Field(description="开始年份（公元前为负整数）")
     end_year: Optional[int] = Field(None, description="结束年份（整数），如果是单年事件则为null")
-    key_figures: str = Field(description="事件中的关键人物列表（逗号分隔的字符串，中文）")
-    description: str = Field(description="事件的简要概述（1-2句话，中文）")
-    impact: str = Field(description="事件的历史影响和意义（中文）")
+    key_figures: str = Field(max_length=150, description="事件中的关键人物列表（逗号分隔的字符串，中文）")
+    description: str = Field(max_length=200, description="事件的简要概述（1-2句话，中文）")
+    impact: str = Field(max_length=200, description="事件的历史影响和意义（中文）")
     category: str = Field(description="事件类别（中文）：政治、技术、军事、经济、文化、宗教、科学。注意：所有宗教相关事件统一使用'宗教'，不要使用细分如'宗教/思想'、'宗教/政治'等")
-    importance_level: int = Field(description="重要性等级（1-10，10为最重要）")
+    importance_level: int = Field(ge=1, le=10, description="重要性等级（1-10，10为最重要）")
+
+    @field_validator("start_year")
+    @classmethod
+    def _nonzero_year(cls, value: int) -> int:
+        """Reject year 0 (there is none), matching validate_event()."""
+        if value == 0:
+            raise ValueError("start_year must not be 0")
+        return value
+
+
+# Validates a whole JSON array of events in one pydantic-core call
+EVENT_LIST_ADAPTER = TypeAdapter(List[EventSchema])
 
 
 class PeriodSchema(BaseModel):
@@ -57,34 +170,97 @@ class PeriodSchema(BaseModel):
     start_year: int = Field(description="开始年份（公元前为负整数）")
     end_year: int = Field(description="结束年份（整数）")
     period_type: str = Field(description="时期类型：'continuous' 表示长期时代（如：中世纪），'independent' 表示特定时期（如：文艺复兴）")
-    description: str = Field(description="该时期的简要描述（中文）")
+    description: str = Field(max_length=200, description="该时期的简要描述（中文）")
+
+
+def _unfence(text: str) -> str:
+    """Return the body of the first code fence in text, or text itself without one."""
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text.strip()
+
+
+def fit_extract(extract: str, budget: int, model: str = None) -> str:
+    """
+    Fit a Wikipedia extract into a token budget, keeping the most relevant paragraphs.
+
+    Extracts within the budget are returned unchanged. Otherwise the lead
+    paragraph is kept, then the remaining paragraphs in order of keyword
+    density (with a bonus under History/Events/Timeline sections) until the
+    budget is spent; kept paragraphs stay in their original order.
+
+    Args:
+        extract: Plain-text Wikipedia extract
+        budget: Token budget
+        model: Model name used for token counting
+
+    Returns:
+        Extract text within the budget
+    """
+    if estimate_tokens(extract, model) <= budget:
+        return extract
+
+    paragraphs = [p for p in extract.split("\n") if p.strip()]
+    scores = []
+    section = ""
+    for paragraph in paragraphs:
+        stripped = paragraph.strip()
+        if stripped.startswith("=="):
+            section = stripped.strip("= ").lower()
+        lowered = paragraph.lower()
+        hits = sum(lowered.count(keyword) for keyword in RELEVANT_KEYWORDS)
+        preferred = any(name in section for name in PREFERRED_SECTIONS)
+        scores.append(hits / len(paragraph) + (1 if preferred else 0))
+
+    order = [0] + sorted(range(1, len(paragraphs)), key=lambda i: -scores[i])
+    kept = {}
+    used = 0
+    for i in order:
+        cost = estimate_tokens(paragraphs[i], model)
+        if used + cost <= budget:
+            kept[i] = paragraphs[i]
+            used += cost
+        elif not kept:
+            kept[i] = truncate_tokens(paragraphs[i], budget, model)
+            used = budget
+
+    return "\n".join(kept[i] for i in sorted(kept))
 
 
 class HistoricalDataProcessor:
     """Processor for structuring historical data using LangChain."""
 
-    def __init__(self, api_key: str = None, base_url: str = None, model: str = None):
+    def __init__(self, api_key: str = None, base_url: str = None, model: str = None,
+                 rpm: int = None, tpm: int = None, cheap_model: str = None):
         """
         Initialize the LangChain processor.
 
         Args:
             api_key: OpenAI API key
             base_url: API base URL
-            model: Model name to use
+            model: Model name to use (defaults to OPENAI_MODEL, then DEFAULT_MODEL)
+            rpm: Requests-per-minute limit (defaults to OPENAI_RPM; DEFAULT_RPM
+                if only a token limit is set, unlimited if neither is)
+            tpm: Tokens-per-minute limit (defaults to OPENAI_TPM, unlimited if unset)
+            cheap_model: Cheaper model tried first, escalating to ``model`` when its
+                response fails to parse (defaults to OPENAI_CHEAP_MODEL, disabled if unset)
         """
         # print(f"args 2: {api_key}, {base_url}, {model}")
         load_dotenv(override=True)
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
-        self.model = model or os.getenv("OPENAI_MODEL")
+        # Resolve the model once: the real-time client, the Batch API body and
+        # the response cache keys must all name the same model
+        self.model = model or os.getenv("OPENAI_MODEL") or DEFAULT_MODEL
 
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY must be provided or set in environment")
 
         llm_kwargs = {
-            "model": model,
+            "model": self.model,
             "temperature": 0.3,
-            "api_key": self.api_key
+            "api_key": self.api_key,
+            # Reuse the process-wide connection pool instead of one per client
+            "http_client": SHARED_SYNC
         }
 
         if self.base_url:
@@ -92,8 +268,71 @@ class HistoricalDataProcessor:
 
         self.llm = ChatOpenAI(**llm_kwargs)
 
+        self.cheap_model = cheap_model or os.getenv("OPENAI_CHEAP_MODEL")
+        self.cheap_llm = ChatOpenAI(**{**llm_kwargs, "model": self.cheap_model}) if self.cheap_model else None
+        self.routing_stats = {"cheap_ok": 0, "escalated": 0}
+
+        # Wait for provider capacity up front instead of retrying after 429s
+        rpm = rpm or int(os.getenv("OPENAI_RPM", 0))
+        tpm = tpm or int(os.getenv("OPENAI_TPM", 0))
+        if rpm or tpm:
+            self.rate_limiter = TokenBucket(rpm or DEFAULT_RPM, tpm or None)
+        else:
+            self.rate_limiter = None
+
         self.event_schemas = self._create_event_schemas()
         self.period_schemas = self._create_period_schemas()
+        self.content_cache = ContentCache()
+
+        # Schema format instructions and prompt templates are the same for
+        # every page, so build them once instead of on every call
+        self._event_fmt = self.event_schemas.get_format_instructions()
+        self._period_fmt = self.period_schemas.get_format_instructions()
+        self._event_page_tpl = ChatPromptTemplate.from_messages([
+            ("system", EVENT_PAGE_SYSTEM_TEMPLATE), ("human", PAGE_HUMAN_TEMPLATE)
+        ]).partial(format_instructions=self._event_fmt)
+        self._period_page_tpl = ChatPromptTemplate.from_messages([
+            ("system", PERIOD_PAGE_SYSTEM_TEMPLATE), ("human", PAGE_HUMAN_TEMPLATE)
+        ]).partial(format_instructions=self._period_fmt)
+        self._year_tpl = ChatPromptTemplate.from_messages([
+            ("system", YEAR_PAGE_SYSTEM_TEMPLATE), ("human", YEAR_PAGE_HUMAN_TEMPLATE)
+        ]).partial(format_instructions=self._event_fmt)
+        self._dynasty_tpl = ChatPromptTemplate.from_messages([
+            ("system", DYNASTY_PAGE_SYSTEM_TEMPLATE), ("human", DYNASTY_PAGE_HUMAN_TEMPLATE)
+        ]).partial(format_instructions=self._event_fmt)
+
+    def _call_llm(self, prompt: List[BaseMessage], cheap: bool = False,
+                  max_tokens: Optional[int] = None) -> str:
+        """
+        Call the LLM once, within the rate limiter's budget when one is set.
+
+        Args:
+            prompt: Formatted prompt messages
+            cheap: Use the cheap model instead of the main one
+            max_tokens: Cap on completion tokens (provider default if None)
+
+        Returns:
+            Response content string
+        """
+        llm = self.cheap_llm if cheap else self.llm
+        kwargs = {"max_tokens": max_tokens} if max_tokens else {}
+        if self.rate_limiter is None:
+            return llm.invoke(prompt, **kwargs).content
+
+        model = self.cheap_model if cheap else self.model
+        text = "".join(message.content for message in prompt)
+        completion = min(max_tokens or ESTIMATED_COMPLETION_TOKENS, ESTIMATED_COMPLETION_TOKENS)
+        estimated = estimate_tokens(text, model) + completion
+        self.rate_limiter.acquire(estimated)
+        actual = estimated
+        try:
+            response = llm.invoke(prompt, **kwargs)
+            usage = getattr(response, "usage_metadata", None)
+            if usage:
+                actual = usage["total_tokens"]
+            return response.content
+        finally:
+            self.rate_limiter.release(estimated, actual)
 
     def _create_event_schemas(self) -> PydanticOutputParser:
         """Create structured output parser for events."""
@@ -120,41 +359,26 @@ class HistoricalDataProcessor:
         if not extract:
             return None
 
-        format_instructions = self.event_schemas.get_format_instructions()
-
-        prompt = ChatPromptTemplate.from_template("""
-你是一位历史学家，正在分析历史事件。从以下维基百科页面内容中提取结构化信息。
-
-标题：{title}
-内容：{content}
-地区：{region}
-
-提取以下信息（所有文本字段必须输出为中文）：
-{format_instructions}
-
-只返回 JSON 对象，不要其他文字。
-""")
-
-        formatted_prompt = prompt.format(
+        prompt_messages = self._event_page_tpl.format_messages(
             title=title,
-            content=extract[:2000],
-            region=region,
-            format_instructions=format_instructions
+            content=fit_extract(extract, TOKEN_BUDGETS["page"], self.model),
+            region=region
         )
 
-        try:
-            response = self.llm.invoke(formatted_prompt)
-            event_schema = self.event_schemas.parse(response.content)
+        event_schema = self._invoke_and_parse(
+            [prompt_messages], lambda _, response: EventSchema.model_validate_json(_unfence(response)),
+            max_tokens=COMPLETION_LIMITS["page"]
+        )[0]
+        if isinstance(event_schema, Exception):
+            print(f"Error processing page {title}: {event_schema}")
+            return None
 
-            # Convert Pydantic model to dict
-            event_data = event_schema.model_dump() if hasattr(event_schema, "model_dump") else event_schema.dict()
-            event_data["region"] = region
-            event_data["source"] = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+        # Convert Pydantic model to dict
+        event_data = event_schema.model_dump()
+        event_data["region"] = region
+        event_data["source"] = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
 
-            return event_data
-        except Exception as e:
-            print(f"Error processing page {title}: {e}")
-            return None
+        return event_data
 
     def process_wikipedia_page_as_period(self, page_content: Dict, region: str) -> Optional[Dict]:
         """
@@ -173,107 +397,369 @@ class HistoricalDataProcessor:
         if not extract:
             return None
 
-        format_instructions = self.period_schemas.get_format_instructions()
+        prompt_messages = self._period_page_tpl.format_messages(
+            title=title,
+            content=fit_extract(extract, TOKEN_BUDGETS["page"], self.model),
+            region=region
+        )
 
-        prompt = ChatPromptTemplate.from_template("""
-你是一位历史学家，正在分析历史时期。从以下维基百科页面内容中提取结构化信息。
+        period_schema = self._invoke_and_parse(
+            [prompt_messages], lambda _, response: PeriodSchema.model_validate_json(_unfence(response)),
+            max_tokens=COMPLETION_LIMITS["page"]
+        )[0]
+        if isinstance(period_schema, Exception):
+            print(f"Error processing period {title}: {period_schema}")
+            return None
 
-标题：{title}
-内容：{content}
-地区：{region}
+        # Convert Pydantic model to dict
+        period_data = period_schema.model_dump()
+        period_data["region"] = region
 
-提取以下信息（所有文本字段必须输出为中文）：
-{format_instructions}
+        return period_data
 
-只返回 JSON 对象，不要其他文字。
-""")
+    def _invoke_many(self, prompts: List[List[BaseMessage]], parse: Callable[[int, str], Any],
+                     concurrency: int = DEFAULT_CONCURRENCY, use_batch_api: bool = False,
+                     cheap: bool = False, max_tokens: Optional[int] = None) -> List[Any]:
+        """
+        Call the LLM for several prompts concurrently, reusing cached responses.
 
-        formatted_prompt = prompt.format(
-            title=title,
-            content=extract[:2000],
-            region=region,
-            format_instructions=format_instructions
-        )
+        Cache misses are dispatched together on a thread pool so the wall
+        clock is roughly ceil(N / concurrency) round trips instead of N.
+        A response is only cached once it parses, so a truncated or malformed
+        response is retried on the next run instead of being replayed; cached
+        entries that no longer parse are evicted and fetched again.
 
-        try:
-            response = self.llm.invoke(formatted_prompt)
-            period_schema = self.period_schemas.parse(response.content)
+        Args:
+            prompts: Formatted prompt messages
+            parse: Callable(prompt_index, response) returning the parsed result
+            concurrency: Maximum number of requests in flight
+            use_batch_api: Send cache misses through the OpenAI Batch API
+                instead (half the token cost, results within 24h)
+            cheap: Use the cheap model instead of the main one
+            max_tokens: Cap on completion tokens per request
+
+        Returns:
+            Parsed results in prompt order, or the exception for prompts that failed
+        """
+        model = self.cheap_model if cheap else self.model
+        keys = [
+            ContentCache.make_key(self.base_url, model, [(m.type, m.content) for m in prompt])
+            for prompt in prompts
+        ]
+        results = [None] * len(prompts)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self.content_cache.get(key)
+            if cached is None:
+                misses.append(i)
+                continue
+            try:
+                results[i] = parse(i, cached)
+            except Exception:
+                # Bad entry cached before responses were checked: drop it and
+                # call this tier again rather than escalating on every run
+                self.content_cache.delete(key)
+                misses.append(i)
+        if not misses:
+            return results
+
+        if use_batch_api:
+            batch_id = self.submit_batch_job([prompts[i] for i in misses], max_tokens)
+            batch_results = self.collect_batch_job(batch_id)
+            contents = [batch_results.get(f"row-{row}") for row in range(len(misses))]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(self._call_llm, prompts[i], cheap, max_tokens) for i in misses]
+            contents = []
+            for future in futures:
+                try:
+                    contents.append(future.result())
+                except Exception as e:
+                    print(f"Error calling LLM: {e}")
+                    contents.append(None)
+
+        for i, content in zip(misses, contents):
+            try:
+                if not content:
+                    raise ValueError("no response from LLM")
+                results[i] = parse(i, content)
+            except Exception as e:
+                results[i] = e
+                continue
+            self.content_cache.put(keys[i], content)
+        return results
+
+    def _invoke_and_parse(self, prompts: List[List[BaseMessage]], parse: Callable[[int, str], Any],
+                          concurrency: int = DEFAULT_CONCURRENCY,
+                          use_batch_api: bool = False,
+                          max_tokens: Optional[int] = None) -> List[Any]:
+        """
+        Call the LLM for several prompts and parse the responses.
 
-            # Convert Pydantic model to dict
-            period_data = period_schema.model_dump() if hasattr(period_schema, "model_dump") else period_schema.dict()
-            period_data["region"] = region
+        With a cheap model configured, every prompt goes to it first and only
+        prompts whose response is missing or fails to parse are retried once
+        with the main model.
 
-            return period_data
-        except Exception as e:
-            print(f"Error processing period {title}: {e}")
-            return None
+        Args:
+            prompts: Formatted prompt messages
+            parse: Callable(prompt_index, response) returning the parsed result
+            concurrency: Maximum number of requests in flight
+            use_batch_api: Send cache misses through the OpenAI Batch API (main model only)
+            max_tokens: Cap on completion tokens per request
 
-    def extract_events_from_year_page(self, year: int, year_content: Dict, region: str) -> List[Dict]:
+        Returns:
+            Parsed results in prompt order, or the exception for prompts that failed
         """
-        Extract events from a specific year page.
+        results = [None] * len(prompts)
+        todo = list(range(len(prompts)))
+        tiers = [True, False] if self.cheap_llm is not None and not use_batch_api else [False]
+
+        for cheap in tiers:
+            tier_results = self._invoke_many(
+                [prompts[i] for i in todo],
+                lambda j, response, todo=todo: parse(todo[j], response),
+                concurrency, use_batch_api, cheap, max_tokens
+            )
+            failed = []
+            for i, result in zip(todo, tier_results):
+                results[i] = result
+                if isinstance(result, Exception):
+                    failed.append(i)
+
+            if cheap:
+                self.routing_stats["cheap_ok"] += len(todo) - len(failed)
+                self.routing_stats["escalated"] += len(failed)
+            todo = failed
+            if not todo:
+                break
+
+        return results
+
+    def print_routing_stats(self) -> None:
+        """Print how many responses the cheap model handled without escalation."""
+        if self.cheap_llm is None:
+            return
+        total = self.routing_stats["cheap_ok"] + self.routing_stats["escalated"]
+        if total:
+            print(f"Cheap model {self.cheap_model}: {self.routing_stats['cheap_ok']}/{total} responses "
+                  f"accepted ({self.routing_stats['cheap_ok'] / total:.0%}), "
+                  f"{self.routing_stats['escalated']} escalated to {self.model}")
+
+    def _openai_client(self):
+        """Create (once) the OpenAI SDK client used for Batch API jobs."""
+        if OpenAI is None:
+            raise ImportError("The Batch API requires the openai package: pip install openai")
+        if getattr(self, "_batch_client", None) is None:
+            self._batch_client = OpenAI(api_key=self.api_key, base_url=self.base_url,
+                                        http_client=SHARED_SYNC)
+        return self._batch_client
+
+    def submit_batch_job(self, prompts: List[List[BaseMessage]], max_tokens: Optional[int] = None) -> str:
+        """
+        Upload prompts as an OpenAI Batch API job.
+
+        Each prompt becomes one chat completion request with custom_id
+        ``row-<index>``.
 
         Args:
-            year: The year number
-            year_content: Wikipedia year page content
-            region: Region
+            prompts: Formatted prompt messages
+            max_tokens: Cap on completion tokens per request
 
         Returns:
-            List of structured event dictionaries
+            Batch job ID
         """
-        extract = year_content.get("extract", "")
-        if not extract:
-            return []
-        print(f"Extracting events from year {year} in {region}")
-        format_instructions = self.event_schemas.get_format_instructions()
+        limits = {"max_tokens": max_tokens} if max_tokens else {}
+        lines = [
+            json.dumps({
+                "custom_id": f"row-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "temperature": 0.3,
+                    "messages": [
+                        {"role": _OPENAI_ROLES[message.type], "content": message.content}
+                        for message in prompt
+                    ],
+                    **limits
+                }
+            }, ensure_ascii=False)
+            for i, prompt in enumerate(prompts)
+        ]
+
+        client = self._openai_client()
+        input_file = client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch job {batch.id} with {len(prompts)} requests")
+        return batch.id
 
-        prompt = ChatPromptTemplate.from_template("""
-为指定年份和地区生成该年度可能发生的重大历史事件。如果页面内容中有相关信息，请结合使用；如果页面内容不足或没有相关信息，请主要基于历史知识生成合理的事件。
+    def collect_batch_job(self, batch_id: str, poll_interval: int = BATCH_POLL_INTERVAL) -> Dict[str, str]:
+        """
+        Wait for a Batch API job to finish and download its results.
 
-年份：{year}
-内容：{content}
-地区：{region}
+        Args:
+            batch_id: Batch job ID from submit_batch_job()
+            poll_interval: Seconds between status checks
 
-提取该年度发生的重要事件。为每个事件提供以下信息（所有文本字段必须输出为中文）：
-{format_instructions}
+        Returns:
+            Dictionary mapping custom_id to response content (failed rows are absent)
+        """
+        client = self._openai_client()
+
+        batch = client.batches.retrieve(batch_id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            print(f"Batch job {batch_id}: {batch.status}, waiting...")
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch_id)
+
+        if not batch.output_file_id:
+            print(f"Batch job {batch_id} finished as {batch.status} without output")
+            return {}
+
+        results = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                print(f"Batch request {row.get('custom_id')} failed: {row.get('error')}")
+                continue
+            results[row["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+        print(f"Batch job {batch_id} {batch.status}: {len(results)} results")
+        return results
+
+    @staticmethod
+    def _parse_events(response: str, region: str, source: str) -> List[Dict]:
+        """
+        Parse and validate an LLM response holding a JSON array (or object) of events.
 
-返回 JSON 数组格式的事件对象，不要其他文字。
-""")
+        Events are validated against EventSchema (coercing e.g. "1492" to 1492
+        and filling optional fields). Events that fail validation are dropped;
+        if none pass, the ValidationError is raised so the page can be retried.
+
+        Args:
+            response: Raw response content
+            region: Region to stamp on every event
+            source: Source URL to stamp on every event
+
+        Returns:
+            List of event dictionaries
+        """
+        content = _unfence(response)
+
+        try:
+            events = json.loads(content)
+        except json.JSONDecodeError:
+            # Recover an array wrapped in leading/trailing prose
+            start, end = content.find("["), content.rfind("]")
+            if start == -1 or end < start:
+                raise
+            events = json.loads(content[start:end + 1])
+
+        if isinstance(events, dict):
+            events = [events]
+        elif not isinstance(events, list):
+            return []
 
-        formatted_prompt = prompt.format(
+        try:
+            validated = EVENT_LIST_ADAPTER.validate_python(events)
+        except ValidationError:
+            # Keep the valid events instead of losing the whole page to one bad item
+            validated = []
+            for event in events:
+                try:
+                    validated.append(EventSchema.model_validate(event))
+                except ValidationError:
+                    pass
+            if not validated:
+                raise
+            print(f"Dropped {len(events) - len(validated)}/{len(events)} events that failed validation")
+
+        events = [event.model_dump() for event in validated]
+        for event in events:
+            event["region"] = region
+            event["source"] = source
+        return events
+
+    def _year_prompt(self, year: int, extract: str, region: str) -> List[BaseMessage]:
+        """Build the extraction prompt for a year page."""
+        return self._year_tpl.format_messages(
             year=year,
-            content=extract[:3000],
+            content=fit_extract(extract, TOKEN_BUDGETS["year"], self.model),
+            region=region
+        )
+
+    def _dynasty_prompt(self, dynasty_name: str, extract: str, region: str, max_events: int) -> List[BaseMessage]:
+        """Build the extraction prompt for a dynasty page."""
+        return self._dynasty_tpl.format_messages(
+            dynasty=dynasty_name,
+            content=fit_extract(extract, TOKEN_BUDGETS["dynasty"], self.model),  # 使用更多内容，因为朝代页面更长
             region=region,
-            format_instructions=format_instructions
+            max_events=max_events
         )
 
-        try:
-            response = self.llm.invoke(formatted_prompt)
-            content = response.content.strip()
+    def extract_events_from_year_page(self, year: int, year_content: Dict, region: str) -> List[Dict]:
+        """
+        Extract events from a specific year page.
 
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                elif content.startswith("python"):
-                    content = content[7:]
-                content = content.strip()
+        Args:
+            year: The year number
+            year_content: Wikipedia year page content
+            region: Region
 
-            events = json.loads(content)
+        Returns:
+            List of structured event dictionaries
+        """
+        return self.extract_events_from_years_batch([(year, year_content, region)])[0]
+
+    def extract_events_from_years_batch(self, year_contents: List[Tuple[int, Dict, str]],
+                                        concurrency: int = DEFAULT_CONCURRENCY,
+                                        use_batch_api: bool = False) -> List[List[Dict]]:
+        """
+        Extract events from several year pages with concurrent LLM calls.
+
+        Args:
+            year_contents: List of (year, year_content, region) tuples
+            concurrency: Maximum number of LLM requests in flight
+            use_batch_api: Extract through the OpenAI Batch API (offline jobs)
 
-            if isinstance(events, list):
-                for event in events:
-                    event["region"] = region
-                    event["source"] = f"https://en.wikipedia.org/wiki/{abs(year)}_{'BC' if year < 0 else ''}"
-                return events
-            elif isinstance(events, dict):
-                events["region"] = region
-                events["source"] = f"https://en.wikipedia.org/wiki/{abs(year)}_{'BC' if year < 0 else ''}"
-                return [events]
+        Returns:
+            List of event lists, aligned with year_contents
+        """
+        results = [[] for _ in year_contents]
+        pending = []
+        for i, (year, year_content, region) in enumerate(year_contents):
+            extract = year_content.get("extract", "")
+            if extract:
+                print(f"Extracting events from year {year} in {region}")
+                pending.append((i, self._year_prompt(year, extract, region)))
+
+        def parse(j: int, response: str) -> List[Dict]:
+            year, _, region = year_contents[pending[j][0]]
+            return self._parse_events(
+                response, region,
+                f"https://en.wikipedia.org/wiki/{abs(year)}_{'BC' if year < 0 else ''}"
+            )
+
+        parsed = self._invoke_and_parse([prompt for _, prompt in pending], parse, concurrency, use_batch_api,
+                                        max_tokens=COMPLETION_LIMITS["year"])
+
+        for (i, _), events in zip(pending, parsed):
+            if isinstance(events, Exception):
+                print(f"Error extracting events from year {year_contents[i][0]}: {events}")
             else:
-                return []
-        except Exception as e:
-            print(f"Error extracting events from year {year}: {e}")
-            return []
+                results[i] = events
+
+        return results
 
     def extract_events_from_dynasty_page(self, dynasty_name: str, dynasty_content: Dict, region: str, max_events: int = 20) -> List[Dict]:
         """
@@ -288,65 +774,48 @@ class HistoricalDataProcessor:
         Returns:
             List of structured event dictionaries
         """
-        extract = dynasty_content.get("extract", "")
-        if not extract:
-            return []
-        print(f"Extracting events from dynasty {dynasty_name} in {region}")
-        format_instructions = self.event_schemas.get_format_instructions()
-
-        prompt = ChatPromptTemplate.from_template("""
-从以下朝代页面内容中提取重要的历史事件。
-
-朝代：{dynasty}
-内容：{content}
-地区：{region}
-
-提取该朝代期间发生的重大历史事件（最多 {max_events} 个）。为每个事件提供以下信息（所有文本字段必须输出为中文）：
-{format_instructions}
-
-请按时间顺序排列事件，并确保涵盖不同类别（政治、军事、文化、经济等）。
-
-返回 JSON 数组格式的事件对象，不要其他文字。
-""")
-
-        formatted_prompt = prompt.format(
-            dynasty=dynasty_name,
-            content=extract[:5000],  # 使用更多内容，因为朝代页面更长
-            region=region,
-            max_events=max_events,
-            format_instructions=format_instructions
-        )
-
-        try:
-            response = self.llm.invoke(formatted_prompt)
-            content = response.content.strip()
-
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                elif content.startswith("python"):
-                    content = content[7:]
-                content = content.strip()
+        return self.extract_events_from_dynasties_batch(
+            [(dynasty_name, dynasty_content, region)], max_events
+        )[0]
+
+    def extract_events_from_dynasties_batch(self, dynasty_contents: List[Tuple[str, Dict, str]],
+                                            max_events: int = 20,
+                                            concurrency: int = DEFAULT_CONCURRENCY,
+                                            use_batch_api: bool = False) -> List[List[Dict]]:
+        """
+        Extract events from several dynasty pages with concurrent LLM calls.
 
-            events = json.loads(content)
+        Args:
+            dynasty_contents: List of (dynasty_name, dynasty_content, region) tuples
+            max_events: Maximum number of events to extract per dynasty
+            concurrency: Maximum number of LLM requests in flight
+            use_batch_api: Extract through the OpenAI Batch API (offline jobs)
 
-            if isinstance(events, list):
-                for event in events:
-                    event["region"] = region
-                    event["source"] = f"https://zh.wikipedia.org/wiki/{dynasty_name}"
-                return events
-            elif isinstance(events, dict):
-                events["region"] = region
-                events["source"] = f"https://zh.wikipedia.org/wiki/{dynasty_name}"
-                return [events]
+        Returns:
+            List of event lists, aligned with dynasty_contents
+        """
+        results = [[] for _ in dynasty_contents]
+        pending = []
+        for i, (dynasty_name, dynasty_content, region) in enumerate(dynasty_contents):
+            extract = dynasty_content.get("extract", "")
+            if extract:
+                print(f"Extracting events from dynasty {dynasty_name} in {region}")
+                pending.append((i, self._dynasty_prompt(dynasty_name, extract, region, max_events)))
+
+        def parse(j: int, response: str) -> List[Dict]:
+            dynasty_name, _, region = dynasty_contents[pending[j][0]]
+            return self._parse_events(response, region, f"https://zh.wikipedia.org/wiki/{dynasty_name}")
+
+        parsed = self._invoke_and_parse([prompt for _, prompt in pending], parse, concurrency, use_batch_api,
+                                        max_tokens=max_events * COMPLETION_TOKENS_PER_EVENT)
+
+        for (i, _), events in zip(pending, parsed):
+            if isinstance(events, Exception):
+                print(f"Error extracting events from dynasty {dynasty_contents[i][0]}: {events}")
             else:
-                return []
-        except Exception as e:
-            print(f"Error extracting events from dynasty {dynasty_name}: {e}")
-            return []
-
+                results[i] = events
 
+        return results
 
     def validate_event(self, event: Dict) -> bool:
         """
@@ -358,23 +827,24 @@ class HistoricalDataProcessor:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = ["event_name", "start_year", "region"]
-        
-        for field in required_fields:
-            if field not in event or not event[field]:
-                return False
-        
-        if not isinstance(event["start_year"], int):
+        # Cheapest and most often failing checks first (year 0 is rejected
+        # as falsy, as before)
+        start_year = event.get("start_year")
+        if not isinstance(start_year, int) or not start_year:
             return False
-        
+
+        if not event.get("event_name") or not event.get("region"):
+            return False
+
+        # EventSchema enforces all of these for LLM output, so callers only
+        # need this for events loaded from disk or built elsewhere; those may
+        # carry "8" or 8.0, which is accepted as before
         if "importance_level" in event:
             try:
                 level = int(event["importance_level"])
-                if level < 1 or level > 10:
-                    return False
             except (ValueError, TypeError):
                 return False
-        
+            return 1 <= level <= 10
         return True
 
 
@@ -23,6 +23,7 @@ except ImportError:
 # Import SQLDatabaseToolkit and create_sql_agent
 try:
     from langchain_community.agent_toolkits import SQLDatabaseToolkit, create_sql_agent
+    from langchain_community.agent_toolkits.sql.prompt import SQL_PREFIX
 except ImportError:
     raise ImportError(
         "SQLDatabaseToolkit or create_sql_agent not found. Install:\n"
@@ -32,6 +33,28 @@ except ImportError:
 # Import LLM
 from langchain_openai import ChatOpenAI
 
+from database_manager import get_engine
+from http_pool import SHARED_SYNC
+
+
+class CachedSQLDatabase(SQLDatabase):
+    """SQLDatabase that reads table metadata from the database only once."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._table_info_cache = {}
+
+    def get_table_info(self, table_names: Optional[List[str]] = None) -> str:
+        """Get table info, cached per requested table set."""
+        key = tuple(sorted(table_names)) if table_names else None
+        if key not in self._table_info_cache:
+            self._table_info_cache[key] = super().get_table_info(table_names)
+        return self._table_info_cache[key]
+
+    def clear_table_info_cache(self) -> None:
+        """Forget cached table info (call after schema changes)."""
+        self._table_info_cache.clear()
+
 
 class TimelineNLQueryEngine:
     """Natural language query engine for timeline database."""
@@ -56,14 +79,19 @@ class TimelineNLQueryEngine:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY must be provided or set in environment")
 
-        # Create LangChain SQLDatabase object
-        self.db = SQLDatabase.from_uri(db_connection_string)
+        # Create LangChain SQLDatabase object on the shared engine; schema
+        # metadata is read once and reused by the agent's schema tools and
+        # get_*_schema()
+        self.db = CachedSQLDatabase(get_engine(db_connection_string))
+        self._schema_cache = self.db.get_table_info()
 
         # Initialize LLM
         llm_kwargs = {
             "model": model,
             "temperature": 0,
-            "api_key": self.api_key
+            "api_key": self.api_key,
+            # Reuse the process-wide connection pool instead of one per client
+            "http_client": SHARED_SYNC
         }
 
         if self.base_url:
@@ -74,10 +102,16 @@ class TimelineNLQueryEngine:
         # Create SQL toolkit
         self.toolkit = SQLDatabaseToolkit(db=self.db, llm=self.llm)
 
+        # Put the full schema in the static system prefix so every turn shares
+        # one cacheable prompt prefix and rarely needs the schema tools
+        # (braces are escaped because the prefix is str.format()-ed)
+        escaped_schema = self._schema_cache.replace("{", "{{").replace("}", "}}")
+
         # Create agent executor
         self.agent_executor = create_sql_agent(
             llm=self.llm,
             toolkit=self.toolkit,
+            prefix=f"{SQL_PREFIX}\n\nDatabase schema:\n{escaped_schema}\n",
             agent_type="tool-calling",
             verbose=True,
             handle_parsing_errors=True,
@@ -110,7 +144,7 @@ class TimelineNLQueryEngine:
 
     def get_all_schemas(self) -> str:
         """Get schema for all tables."""
-        return self.db.get_table_info()
+        return self._schema_cache
 
 
 def create_sql_query_engine(db_connection_string: str = "sqlite:///data.db",
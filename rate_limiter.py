@@ -0,0 +1,135 @@
+"""
+Proactive Rate Limiter for LLM Requests
+
+This module provides a thread-safe token bucket that tracks both requests
+per minute (RPM) and tokens per minute (TPM), so concurrent LLM calls wait
+for capacity up front instead of hitting 429s and sleeping in retry backoff.
+It also provides the token counting helpers used to budget prompts.
+"""
+
+import time
+import threading
+
+# Optional: tiktoken gives exact prompt token counts
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+def _encoding(model: str = None):
+    """Get the tiktoken encoding for a model, falling back to cl100k_base."""
+    try:
+        return tiktoken.encoding_for_model(model or "")
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(text: str, model: str = None) -> int:
+    """
+    Estimate the token count of a prompt.
+
+    Args:
+        text: Prompt text
+        model: Model name used to pick the tiktoken encoding
+
+    Returns:
+        Token count (exact with tiktoken; otherwise ~4 ASCII characters
+        per token and one token per CJK/other non-ASCII character)
+    """
+    if tiktoken is not None:
+        return len(_encoding(model).encode(text))
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = None) -> str:
+    """
+    Cut text down to at most max_tokens tokens.
+
+    Args:
+        text: Text to cut
+        max_tokens: Token budget
+        model: Model name used to pick the tiktoken encoding
+
+    Returns:
+        The longest prefix of text within the budget
+    """
+    if tiktoken is not None:
+        encoding = _encoding(model)
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+
+    # Without tiktoken, binary-search the longest prefix whose estimate fits
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+class TokenBucket:
+    """Token bucket limiting requests and tokens per minute across threads."""
+
+    def __init__(self, rpm: int, tpm: int = None):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rpm: Allowed requests per minute
+            tpm: Allowed tokens per minute (prompt + completion); None limits
+                requests only (e.g. for plain HTTP APIs)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        """Add the capacity accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until one request and the given tokens are available.
+
+        Args:
+            tokens: Estimated tokens the request will consume (ignored without tpm)
+        """
+        tokens = min(tokens, self.tpm) if self.tpm else 0
+        with self._cond:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                wait = (1 - self._requests) * 60 / self.rpm
+                if tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+                self._cond.wait(wait)
+
+    def release(self, estimated: int, actual: int) -> None:
+        """
+        Settle a request's estimate against its actual usage.
+
+        Args:
+            estimated: Tokens reserved by acquire()
+            actual: Tokens reported by the provider (ignored without tpm)
+        """
+        if not self.tpm:
+            # Requests-only bucket: acquire() reserved no tokens to settle
+            return
+        with self._cond:
+            self._refill()
+            self._tokens = min(self.tpm, self._tokens + estimated - actual)
+            self._cond.notify_all()
@@ -0,0 +1,80 @@
+import pytest
+
+import wikipedia_scraper
+from wikipedia_scraper import WikipediaAPIError, WikipediaScraper
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, data, status_code=200, headers=None):
+        self._data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Scraper with its caches under tmp_path and no rate limiting or sleeps."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("WIKIPEDIA_RPM", "0")
+    monkeypatch.delenv("WIKIPEDIA_REFRESH", raising=False)
+    monkeypatch.setattr(wikipedia_scraper.time, "sleep", lambda seconds: None)
+    return WikipediaScraper()
+
+
+def queue_responses(scraper, monkeypatch, responses):
+    """Make session.get return the given responses in order and record calls."""
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(scraper.session, "get", fake_get)
+    return calls
+
+
+def test_api_error_is_raised_and_not_cached(scraper, monkeypatch):
+    error = {"error": {"code": "badtitle", "info": "Bad title"}}
+    ok = {"query": {"search": [{"pageid": 1}]}}
+    calls = queue_responses(scraper, monkeypatch, [FakeResponse(error), FakeResponse(ok)])
+    params = {"action": "query", "list": "search", "srsearch": "Rome"}
+
+    with pytest.raises(WikipediaAPIError) as excinfo:
+        scraper._get_json(params)
+    assert excinfo.value.code == "badtitle"
+
+    # The error was not cached, so the next call goes back to the API
+    assert scraper._get_json(params) == ok
+    assert len(calls) == 2
+
+
+def test_transient_api_error_is_retried(scraper, monkeypatch):
+    maxlag = {"error": {"code": "maxlag", "info": "Waiting for a database server"}}
+    ok = {"query": {"pages": {}}}
+    calls = queue_responses(
+        scraper, monkeypatch,
+        [FakeResponse(maxlag, headers={"Retry-After": "5"}), FakeResponse(ok)]
+    )
+    params = {"action": "query", "titles": "1492"}
+
+    assert scraper._get_json(params) == ok
+    assert len(calls) == 2
+
+    # Only the successful response was cached
+    assert scraper._get_json(params) == ok
+    assert len(calls) == 2
+
+
+def test_search_pages_returns_empty_on_api_error(scraper, monkeypatch):
+    error = {"error": {"code": "ratelimited", "info": "Slow down"}}
+    queue_responses(scraper, monkeypatch, [FakeResponse(error)] * (wikipedia_scraper.MAX_RETRIES + 1))
+
+    assert scraper.search_pages("Rome") == []
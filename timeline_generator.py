@@ -6,7 +6,8 @@
 """
 
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Callable
 
 from wikipedia_scraper import WikipediaScraper
@@ -14,6 +15,12 @@ from langchain_processor import HistoricalDataProcessor
 from database_manager import DatabaseManager
 from cache_manager import CacheManager
 
+# 欧洲文明检索词的并发线程数（受 LLM 服务商 RPM 上限约束）
+CIVILIZATION_WORKERS = 8
+
+# 缓存未命中的 Wikipedia 页面并发抓取线程数
+FETCH_WORKERS = 8
+
 
 class TimelineGenerator:
     """
@@ -89,6 +96,7 @@ class TimelineGenerator:
                             max_events_per_dynasty: int = 50,
                             min_importance: int = 5,
                             force_refresh: bool = False,
+                            use_batch_api: bool = False,
                             progress_callback: Optional[Callable] = None) -> Dict[str, int]:
         """
         Scrape Chinese history by dynasty pages instead of year pages.
@@ -98,6 +106,7 @@ class TimelineGenerator:
             max_events_per_dynasty: Maximum number of events to extract per dynasty
             min_importance: Minimum importance level for events to save
             force_refresh: Force re-scraping and re-processing
+            use_batch_api: Extract through the OpenAI Batch API (offline runs, half the token cost)
             progress_callback: Optional callback for progress updates
 
         Returns:
@@ -111,6 +120,9 @@ class TimelineGenerator:
         periods_inserted = 0
         total_dynasties = len(self.CHINESE_DYNASTIES)
 
+        # 先处理 LLM 缓存命中的朝代，未命中的收集起来统一并发交给 LLM
+        pending = []
+
         for i, dynasty in enumerate(self.CHINESE_DYNASTIES):
             if progress_callback:
                 progress = (i + 1) / total_dynasties * 100
@@ -121,60 +133,53 @@ class TimelineGenerator:
                 cached_events = self.cache.load_llm_data(self.region, dynasty)
                 if cached_events:
                     print(f"Cache hit: {self.region}_{dynasty} (LLM)")
-                    for event in cached_events:
-                        if self.processor and self.processor.validate_event(event):
-                            importance = int(event.get("importance_level", 5))
-                            if importance >= min_importance:
-                                self.db.insert_event(event)
-                                events_inserted += 1
-                        elif not self.processor:
-                            self.db.insert_event(event)
-                            events_inserted += 1
+                    events_inserted += self._insert_filtered_events(cached_events, min_importance)
                     continue
 
             # No LLM cache - try to use Raw cache or scrape
-            dynasty_content = None
-
             if not force_refresh:
                 cached_raw = self.cache.load_raw_data(self.region, dynasty)
                 if cached_raw:
                     print(f"Cache hit: {self.region}_{dynasty} (Raw), processing with LLM...")
-                    dynasty_content = cached_raw
-                else:
-                    print(f"Cache miss: {self.region}_{dynasty}, scraping from Wikipedia...")
-                    dynasty_content = self.scraper.get_dynasty_page(dynasty)
+                    pending.append((dynasty, cached_raw))
+                    continue
+                print(f"Cache miss: {self.region}_{dynasty}, scraping from Wikipedia...")
             else:
                 print(f"Force refresh: {self.region}_{dynasty}, scraping from Wikipedia...")
-                dynasty_content = self.scraper.get_dynasty_page(dynasty)
-
-            if dynasty_content:
-                if self.has_processor:
-                    events = self.processor.extract_events_from_dynasty_page(
-                        dynasty,
-                        dynasty_content,
-                        self.region,
-                        max_events_per_dynasty
-                    )
-                    # Save to LLM cache
-                    self.cache.save_llm_data(self.region, dynasty, events)
-                    print(f"Cache saved: {self.region}_{dynasty} (LLM)")
-                else:
-                    events = self._simple_extract_events_from_dynasty(dynasty, dynasty_content)
+            pending.append((dynasty, None))
 
-                # Insert events into database
-                for event in events:
-                    if self.processor and self.processor.validate_event(event):
-                        importance = int(event.get("importance_level", 5))
-                        if importance >= min_importance:
-                            self.db.insert_event(event)
-                            events_inserted += 1
-                    elif not self.processor:
-                        self.db.insert_event(event)
-                        events_inserted += 1
+        # 需要抓取的朝代页面并发下载
+        fetched = self._fetch_pages(
+            lambda dynasty: self.scraper.get_dynasty_page(dynasty, force_refresh=force_refresh),
+            [dynasty for dynasty, content in pending if content is None]
+        )
+        pending = [(dynasty, content or fetched.get(dynasty)) for dynasty, content in pending]
+        pending = [(dynasty, content) for dynasty, content in pending if content]
+
+        if self.has_processor:
+            extracted = self.processor.extract_events_from_dynasties_batch(
+                [(dynasty, dynasty_content, self.region) for dynasty, dynasty_content in pending],
+                max_events_per_dynasty,
+                use_batch_api=use_batch_api
+            )
+        else:
+            extracted = [self._simple_extract_events_from_dynasty(dynasty, dynasty_content)
+                         for dynasty, dynasty_content in pending]
+
+        for (dynasty, _), events in zip(pending, extracted):
+            if self.has_processor:
+                # Save to LLM cache
+                self.cache.save_llm_data(self.region, dynasty, events)
+                print(f"Cache saved: {self.region}_{dynasty} (LLM)")
 
-                print(f"  {dynasty}: {len(events)} events extracted")
+            # Insert events into database (fresh processor output is already validated)
+            events_inserted += self._insert_filtered_events(
+                events, min_importance, trusted=self.has_processor
+            )
+            print(f"  {dynasty}: {len(events)} events extracted")
 
-            time.sleep(0.5)
+        if self.has_processor:
+            self.processor.print_routing_stats()
 
         print(f"Total inserted: {events_inserted} events")
         return {"events": events_inserted, "periods": periods_inserted}
@@ -210,7 +215,6 @@ class TimelineGenerator:
             year_content = self.scraper.get_year_page(year)
 
             if not year_content:
-                time.sleep(0.5)
                 continue
 
             if process_with_llm and self.has_processor:
@@ -222,16 +226,10 @@ class TimelineGenerator:
             else:
                 events = self._simple_extract_events(year, year_content)
 
-            for event in events:
-                if self.processor and self.processor.validate_event(event):
-                    self.db.insert_event(event)
-                    events_inserted += 1
-                elif not self.processor:
+            if not self.processor:
+                for event in events:
                     event["importance_level"] = 5
-                    self.db.insert_event(event)
-                    events_inserted += 1
-
-            time.sleep(0.5)
+            events_inserted += self._insert_filtered_events(events, min_importance=1)
 
         print(f"Inserted {events_inserted} events")
         return {"events": events_inserted, "periods": periods_inserted}
@@ -253,7 +251,7 @@ class TimelineGenerator:
 
         search_results = self.scraper.search_historical_periods(self.region)
 
-        events_inserted = 0
+        events = []
         periods_inserted = 0
 
         for result in search_results[:num_events]:
@@ -271,18 +269,66 @@ class TimelineGenerator:
                 event = self._simple_extract_event(page_content)
 
             if event:
-                if self.processor and self.processor.validate_event(event):
-                    self.db.insert_event(event)
-                    events_inserted += 1
-                elif not self.processor:
-                    self.db.insert_event(event)
-                    events_inserted += 1
+                events.append(event)
 
-            time.sleep(0.5)
+        # 所有页面处理完后一次性写入（单个事务）
+        events_inserted = self._insert_filtered_events(events, min_importance=1)
 
         print(f"Inserted {events_inserted} events")
         return {"events": events_inserted, "periods": periods_inserted}
 
+    def _fetch_pages(self, fetch: Callable, keys: List) -> Dict:
+        """
+        Fetch Wikipedia pages for several keys concurrently.
+
+        Pacing is left to the scraper, which backs off on Retry-After.
+
+        Args:
+            fetch: Callable(key) returning page content or None
+            keys: Years or page names to fetch
+
+        Returns:
+            Dictionary mapping key to page content (None when fetching failed)
+        """
+        if not keys:
+            return {}
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            return dict(zip(keys, executor.map(fetch, keys)))
+
+    def _insert_filtered_events(self, events: List[Dict], min_importance: int,
+                                trusted: bool = False) -> int:
+        """
+        Insert events that pass validation and the importance threshold.
+
+        Without a processor every event is inserted as-is. Kept events are
+        written with one bulk insert instead of a statement per event.
+
+        Args:
+            events: Event dictionaries to insert
+            min_importance: Minimum importance level to keep events
+            trusted: Events were just produced by the processor and already
+                passed EventSchema, so only the importance filter is applied
+
+        Returns:
+            Number of inserted events
+        """
+        if not self.processor:
+            return self.db.batch_insert_events(events)
+
+        if trusted:
+            return self.db.batch_insert_events(
+                [event for event in events if event["importance_level"] >= min_importance]
+            )
+
+        # Cached events may carry importance_level as "8" or 8.0, which
+        # validate_event() accepts, so compare the int value
+        validate = self.processor.validate_event
+        kept = [
+            event for event in events
+            if validate(event) and int(event.get("importance_level", 5)) >= min_importance
+        ]
+        return self.db.batch_insert_events(kept)
+
     def _simple_extract_event(self, page_content: Dict) -> Optional[Dict]:
         """
         Simple event extraction without LLM.
@@ -438,15 +484,13 @@ class TimelineGenerator:
         """
         print(f"Scraping {len(period_names)} key periods for {self.region}...")
 
-        periods_inserted = 0
+        periods = []
         events_inserted = 0
 
         for i, period_name in enumerate(period_names):
             if progress_callback:
                 progress_callback(f"Processing period {i+1}/{len(period_names)}: {period_name}")
 
-            time.sleep(0.5)
-
             search_results = self.scraper.search_pages(period_name, limit=3)
 
             if search_results:
@@ -469,10 +513,10 @@ class TimelineGenerator:
                         }
 
                     if period_data:
-                        self.db.insert_period(period_data)
-                        periods_inserted += 1
+                        periods.append(period_data)
 
-            time.sleep(0.5)
+        # 所有时期处理完后一次性写入（单个事务）
+        periods_inserted = self.db.batch_insert_periods(periods)
 
         print(f"Inserted {periods_inserted} periods")
         return {"events": events_inserted, "periods": periods_inserted}
@@ -486,6 +530,7 @@ class TimelineGenerator:
                     twenty_first_century_years: int = 1,
                     min_importance: int = 6,
                     force_refresh: bool = False,
+                    use_batch_api: bool = False,
                     progress_callback: Optional[Callable] = None) -> Dict[str, int]:
         """
         Scrape historical timeline from -1000 to 2026 using phased sampling.
@@ -500,6 +545,7 @@ class TimelineGenerator:
             twenty_first_century_years: Sampling interval for 21st century (2000 to 2026)
             min_importance: Minimum importance level to keep events
             force_refresh: Force re-scraping and re-processing
+            use_batch_api: Extract through the OpenAI Batch API (offline runs, half the token cost)
             progress_callback: Optional callback for progress updates
 
         Returns:
@@ -527,65 +573,62 @@ class TimelineGenerator:
             years_to_scrape = list(range(start_year, end_year + 1, interval))
             print(f"  {phase_name}: scraping {len(years_to_scrape)} years ({start_year}-{end_year})")
 
+            # 先处理 LLM 缓存命中的年份，未命中的收集起来按阶段统一并发交给 LLM
+            pending = []
+
             for year in years_to_scrape:
                 # Check LLM cache first
                 if not force_refresh:
                     cached_events = self.cache.load_llm_data(self.region, year)
                     if cached_events:
                         print(f"Cache hit: {self.region}_{year} (LLM)")
-                        for event in cached_events:
-                            if self.processor and self.processor.validate_event(event):
-                                importance = int(event.get("importance_level", 5))
-                                if importance >= min_importance:
-                                    self.db.insert_event(event)
-                                    events_inserted += 1
-                            elif not self.processor:
-                                self.db.insert_event(event)
-                                events_inserted += 1
+                        events_inserted += self._insert_filtered_events(cached_events, min_importance)
                         continue
 
                 # No LLM cache - try to use Raw cache or scrape
-                year_content = None
-
                 if not force_refresh:
                     cached_raw = self.cache.load_raw_data(self.region, year)
                     if cached_raw:
                         print(f"Cache hit: {self.region}_{year} (Raw), processing with LLM...")
-                        year_content = cached_raw
-                    else:
-                        print(f"Cache miss: {self.region}_{year}, scraping from Wikipedia...")
-                        year_content = self.scraper.get_year_page(year, force_refresh=False)
+                        pending.append((year, cached_raw))
+                        continue
+                    print(f"Cache miss: {self.region}_{year}, scraping from Wikipedia...")
                 else:
                     print(f"Force refresh: {self.region}_{year}, scraping from Wikipedia...")
-                    year_content = self.scraper.get_year_page(year, force_refresh=True)
-
-                if year_content:
-                    if self.has_processor:
-                        events = self.processor.extract_events_from_year_page(
-                            year,
-                            year_content,
-                            self.region
-                        )
-                        # Save to LLM cache
-                        self.cache.save_llm_data(self.region, year, events)
-                        print(f"Cache saved: {self.region}_{year} (LLM)")
-                    else:
-                        events = self._simple_extract_events(year, year_content)
+                pending.append((year, None))
+
+            # 需要抓取的年份页面并发下载
+            fetched = self._fetch_pages(
+                lambda year: self.scraper.get_year_page(year, force_refresh=force_refresh),
+                [year for year, content in pending if content is None]
+            )
+            pending = [(year, content or fetched.get(year)) for year, content in pending]
+            pending = [(year, content) for year, content in pending if content]
+
+            if self.has_processor:
+                extracted = self.processor.extract_events_from_years_batch(
+                    [(year, year_content, self.region) for year, year_content in pending],
+                    use_batch_api=use_batch_api
+                )
+            else:
+                extracted = [self._simple_extract_events(year, year_content)
+                             for year, year_content in pending]
 
-                    for event in events:
-                        if self.processor and self.processor.validate_event(event):
-                            importance = int(event.get("importance_level", 5))
-                            if importance >= min_importance:
-                                self.db.insert_event(event)
-                                events_inserted += 1
-                        elif not self.processor:
-                            self.db.insert_event(event)
-                            events_inserted += 1
+            for (year, _), events in zip(pending, extracted):
+                if self.has_processor:
+                    # Save to LLM cache
+                    self.cache.save_llm_data(self.region, year, events)
+                    print(f"Cache saved: {self.region}_{year} (LLM)")
 
-                time.sleep(0.3)
+                events_inserted += self._insert_filtered_events(
+                    events, min_importance, trusted=self.has_processor
+                )
 
         print(f"    Completed {phase_name}")
 
+        if self.has_processor:
+            self.processor.print_routing_stats()
+
         print(f"Total events inserted: {events_inserted}")
         return {"events": events_inserted, "periods": 0}
 
@@ -651,7 +694,8 @@ class TimelineGenerator:
         Uses English Wikipedia (for European history), but saves Chinese LLM cache.
 
         Args:
-            max_events_per_period: Maximum events to extract per period
+            max_events_per_period: Maximum events to extract per period (unused:
+                each term's page is extracted as a single event)
             min_importance: Minimum importance level for events
             progress_callback: Optional callback for progress updates
 
@@ -662,92 +706,122 @@ class TimelineGenerator:
         if progress_callback:
             progress_callback(f"Starting European civilizations timeline generation")
 
+        all_terms = self.ANCIENT_SEARCH_TERMS + self.MEDIEVAL_SEARCH_TERMS + self.EARLY_MODERN_SEARCH_TERMS
         events_inserted = 0
-        total_periods = len(self.ANCIENT_SEARCH_TERMS + self.MEDIEVAL_SEARCH_TERMS + self.EARLY_MODERN_SEARCH_TERMS)
 
-        for i, search_terms in enumerate([self.ANCIENT_SEARCH_TERMS, self.MEDIEVAL_SEARCH_TERMS, self.EARLY_MODERN_SEARCH_TERMS]):
-            if progress_callback:
-                period_num = i + 1
-                progress = period_num / total_periods * 100
-                progress_callback(f"Processing period {period_num}/{total_periods} ({progress:.1f}%)")
+        # 一次性取出已有欧洲事件的 (名称, 起始年份)，查重改为集合判断，不再每个事件查一次数据库
+        existing = self.db.get_event_keys(region='European')
+        # 多线程共享查重集合、原始缓存文件和数据库写入，用一把锁保护
+        lock = threading.Lock()
+
+        # 各检索词之间互不依赖，耗时主要在 HTTP 和 LLM 调用上，并发处理
+        with ThreadPoolExecutor(max_workers=CIVILIZATION_WORKERS) as executor:
+            futures = {
+                executor.submit(self._process_term, term, existing, lock): term
+                for term in all_terms
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                term = futures[future]
+                try:
+                    events_inserted += future.result()
+                except Exception as e:
+                    print(f"  Error processing '{term}': {e}")
 
-            # Process each search term in the period
-            for j, term in enumerate(search_terms):
                 if progress_callback:
-                    period_progress = (i * len(search_terms) + j) / (total_periods * len(self.ANCIENT_SEARCH_TERMS)) * 100
-                    progress_callback(f"  Processing term {j+1}/{len(search_terms)}: {term}")
+                    progress = done / len(all_terms) * 100
+                    progress_callback(f"Processed term {done}/{len(all_terms)} ({progress:.1f}%): {term}")
 
-                # Search Wikipedia for the term
-                search_results = self.scraper.search_pages(term, limit=3)
+        print(f"Total civilizations timeline events inserted: {events_inserted}")
+        return {"events": events_inserted, "periods": 0}
 
-                if not search_results:
-                    print(f"  No results found for '{term}'")
-                    continue
+    def _process_term(self, term: str, existing: set, lock: threading.Lock) -> int:
+        """
+        Search, fetch, extract and insert events for one civilization search term.
 
-                # Get the first result's content (in English from English Wikipedia)
-                page_content = self.scraper.get_page_content(search_results[0]['pageid'])
+        Args:
+            term: Wikipedia search term
+            existing: Shared (event_name, start_year) keys used for duplicate checks
+            lock: Lock guarding existing, the raw cache file and DB inserts
 
-                if not page_content:
-                    print(f"  Failed to fetch page content for '{term}'")
+        Returns:
+            Number of inserted events
+        """
+        # LLM 结果按规范化的检索词缓存（"Ancient Rome" 与 "ancient rome" 共用），
+        # 命中时跳过搜索、抓取和 LLM
+        cache_key = term.strip().lower().replace(" ", "_")
+        events = self.cache.load_llm_data('European', cache_key)
+        if events:
+            print(f"Cache hit: European_{cache_key} (LLM)")
+        else:
+            events = self._extract_term_events(term, lock)
+            if events and self.has_processor:
+                self.cache.save_llm_data('European', cache_key, events)
+                print(f"Cache saved: European_{cache_key} (LLM)")
+
+        if not events:
+            print(f"  No events extracted from '{term}'")
+            return 0
+
+        with lock:
+            # Same name within 5 years of an existing event counts as a duplicate
+            new_events = []
+            for event in events:
+                name, start = event['event_name'], event['start_year']
+                if any((name, year) in existing for year in range(start - 5, start + 6)):
+                    print(f"  Skipping duplicate: {name} ({start})")
                     continue
 
-                # Save raw Wikipedia content to cache first
-                raw_content = {
-                    'title': page_content['title'],
-                    'extract': page_content.get('extract', ''),
-                    'url': f"https://en.wikipedia.org/wiki/{page_content['title'].replace(' ', '_')}",
-                    'region': 'European',
-                    'year': None  # Will be determined during processing
-                }
-                self.cache.save_raw_data('European', 0, raw_content)
-
-                # COMMENTED OUT: Original LLM processing approach
-                # This code would call the LLM processor to analyze the raw content and extract structured events
-                events = self.processor.process_wikipedia_page_as_event(
-                    page_content['title'],
-                    page_content.get('extract', ''),
-                    'European',
-                    max_events_per_period
-                )
-                # Save to LLM cache
-                # TODO: 这里需要增加方法，之前只有年份的缓存，现在应该是事件名
-                # self.cache.save_llm_data(self.region, year, events)
-                # print(f"Cache saved: {self.region}_{year} (LLM)")
+                existing.add((name, start))
+                new_events.append(event)
 
-                if not events:
-                    print(f"  No events extracted from '{term}'")
-                    continue
+            # Insert the term's new events in one transaction
+            inserted = self.db.batch_insert_events(new_events)
 
-                # Check database for duplicates and cache
-                for event in events:
-                    # Check if event already exists in database
-                    existing_events = self.db.get_events_by_time_range(
-                        event['start_year'] - 5, event['start_year'] + 5,
-                        region='European',
-                        limit=100
-                    )
-                    
-                    event_key = (event['event_name'], event['start_year'])
-                    is_duplicate = False
-                    for existing in existing_events:
-                        if existing['event_name'] == event['event_name'] and abs(existing['start_year'] - event['start_year']) <= 5:
-                            is_duplicate = True
-                            break
-                    
-                    if is_duplicate:
-                        print(f"  Skipping duplicate: {event['event_name']} ({event['start_year']})")
-                        continue
+        print(f"  {term}: {len(events)} events extracted")
+        return inserted
+
+    def _extract_term_events(self, term: str, lock: threading.Lock) -> List[Dict]:
+        """
+        Search Wikipedia for a civilization term and extract its event.
 
-                    # Insert into database
-                    self.db.insert_event(event)
-                    events_inserted += 1
+        Args:
+            term: Wikipedia search term
+            lock: Lock guarding the raw cache file
 
-                print(f"  {term}: {len(events)} events extracted")
+        Returns:
+            List of extracted event dictionaries (empty on failure)
+        """
+        # Search Wikipedia for the term
+        search_results = self.scraper.search_pages(term, limit=3)
 
-            time.sleep(0.5)
+        if not search_results:
+            print(f"  No results found for '{term}'")
+            return []
 
-        print(f"Total civilizations timeline events inserted: {events_inserted}")
-        return {"events": events_inserted, "periods": 0}
+        # Get the first result's content (in English from English Wikipedia)
+        page_content = self.scraper.get_page_content(search_results[0]['pageid'])
+
+        if not page_content:
+            print(f"  Failed to fetch page content for '{term}'")
+            return []
+
+        # Save raw Wikipedia content to cache first
+        raw_content = {
+            'title': page_content['title'],
+            'extract': page_content.get('extract', ''),
+            'url': f"https://en.wikipedia.org/wiki/{page_content['title'].replace(' ', '_')}",
+            'region': 'European',
+            'year': None  # Will be determined during processing
+        }
+        with lock:
+            self.cache.save_raw_data('European', 0, raw_content)
+
+        # 整页作为一个事件交给 LLM 处理，返回单个事件字典或 None
+        if self.has_processor:
+            event = self.processor.process_wikipedia_page_as_event(page_content, 'European')
+        else:
+            event = self._simple_extract_event(page_content)
+        return [event] if event else []
 
     # TODO: 需要确定基于事件的缓存结构，再实现这个从缓存读取的方法
     def _extract_events_from_cached_raw_content(self, raw_content: Dict, region: str, max_events: int) -> List[Dict]:
@@ -7,6 +7,13 @@
 import sqlite3
 import re
 
+# 循环内复用的 SQL 语句，保持文本不变以命中 sqlite3 的语句缓存
+_SQL_UPDATE_PERIOD = '''
+    UPDATE periods
+    SET era_characteristics = ?, key_legacy = ?
+    WHERE period_name = ? AND region = "European"
+'''
+
 # 欧洲时期的历史学分析数据
 european_periods_analysis = {
     "Ancient Greece": {
@@ -160,11 +167,7 @@ def main():
         key_legacy = analysis['key_legacy']
         
         # 更新数据库
-        cursor.execute('''
-            UPDATE periods 
-            SET era_characteristics = ?, key_legacy = ?
-            WHERE period_name = ? AND region = "European"
-        ''', (era_characteristics, key_legacy, period_name))
+        cursor.execute(_SQL_UPDATE_PERIOD, (era_characteristics, key_legacy, period_name))
         
         if cursor.rowcount > 0:
             print(f"✅ 更新时期: {period_name}")
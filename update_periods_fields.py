@@ -9,6 +9,14 @@ import json
 import sqlite3
 import re
 
+try:
+    import orjson  # 可选依赖：解析速度比标准库 json 快 2-3 倍
+except ImportError:
+    orjson = None
+
+# 年份字符串中的数字部分（模块加载时编译一次）
+YEAR_NUM_RE = re.compile(r'(\d+)')
+
 def parse_year_range(year_str):
     """解析年份范围字符串"""
     year_str = year_str.strip()
@@ -32,76 +40,89 @@ def parse_year_range(year_str):
 def parse_single_year(year_str):
     """解析单个年份"""
     year_str = year_str.strip()
+    lower = year_str.lower()
     
-    if year_str.lower() == 'present':
+    if lower == 'present':
         return 2026
     
-    num_match = re.search(r'(\d+)', year_str)
+    num_match = YEAR_NUM_RE.search(year_str)
     if not num_match:
         raise ValueError(f"无法从 '{year_str}' 提取年份")
     
     year_num = int(num_match.group(1))
     
-    if 'bc' in year_str.lower():
+    if 'bc' in lower:
         return -year_num
     
     return year_num
 
+# 按时期名称匹配的规则：(必须全部出现的关键词, 对应条目)，按顺序取第一条命中的规则
+ERA_RULES = (
+    (('civilization',), ("高度发达的城市文明", "复杂的社会结构", "先进的技术和艺术")),
+    (('empire',), ("大规模领土扩张", "中央集权统治", "多民族融合")),
+    (('republic',), ("公民政治参与", "法治传统", "选举制度")),
+    (('kingdom',), ("世袭君主制", "封建等级制度", "贵族统治")),
+    (('renaissance',), ("文化复兴", "人文主义兴起", "艺术创新")),
+    (('revival',), ("文化复兴", "人文主义兴起", "艺术创新")),
+    (('industrial',), ("工业化生产", "技术革新", "城市化进程")),
+)
+
+# 事件类别对应的时期特征
+CATEGORY_CHARACTERISTICS = (
+    ('政治变革', "政治制度变革"),
+    ('军事', "军事冲突频繁"),
+    ('文化艺术', "文化艺术繁荣"),
+    ('科技/生产力', "科技进步显著"),
+    ('经济', "经济发展活跃"),
+)
+
+# 按时期名称匹配的历史影响，规则格式同 ERA_RULES
+LEGACY_RULES = (
+    (('minoan',), ("欧洲最早的城市文明雏形", "宫殿经济模式的开创者", "爱琴海文明的基础")),
+    (('mycenaean',), ("希腊古典文明的直接源头", "特洛伊战争的历史背景", "线性文字B的使用者")),
+    (('classical greece',), ("民主政治的诞生地", "哲学思想的黄金时代", "西方文明的基石")),
+    (('roman', 'republic'), ("共和政治制度的典范", "法治传统的建立", "公民权利概念的形成")),
+    (('roman', 'empire'), ("罗马和平的实现", "法律体系的完善", "基础设施建设的巅峰")),
+    # 含 roman 但既非 republic 也非 empire 的名称到此为止，不再匹配后续规则
+    (('roman',), ()),
+    (('migration period',), ("现代欧洲民族格局的形成", "古典文明向中世纪的过渡", "基督教在欧洲的传播")),
+    (('byzantine',), ("东罗马帝国的延续", "基督教东正教的形成", "古典文化的保护者")),
+    (('carolingian',), ("神圣罗马帝国的雏形", "加洛林文艺复兴", "欧洲统一的早期尝试")),
+    (('holy roman empire',), ("中世纪欧洲的政治秩序", "德意志民族国家的形成", "教皇与皇帝的权力斗争")),
+    (('french revolution',), ("现代民主革命的开端", "人权宣言的发表", "民族主义思想的传播")),
+)
+
+# 事件名称关键词对应的历史影响，每个事件取第一条命中的
+EVENT_LEGACY = {
+    '奥林匹克': "奥林匹克运动传统的创立",
+    '梭伦': "雅典民主政治的奠基",
+    '马拉松': "希腊战胜波斯的标志性胜利",
+    '帕特农神庙': "古典建筑艺术的巅峰",
+    '苏格拉底': "西方哲学理性主义传统的开端",
+    '卢比孔河': "罗马共和制的终结",
+}
+
+def match_name_rules(period_name, rules):
+    """按顺序返回第一条关键词全部命中的规则条目（名称只转一次小写）"""
+    lower = period_name.lower()
+    for keywords, points in rules:
+        if all(keyword in lower for keyword in keywords):
+            return list(points)
+    return []
+
 def extract_era_characteristics(period_name, period_data, events):
     """
     从时期数据中提取时期特征
     """
-    characteristics = []
-    
     # 基于时期名称的特征
-    if 'civilization' in period_name.lower():
-        characteristics.append("高度发达的城市文明")
-        characteristics.append("复杂的社会结构")
-        characteristics.append("先进的技术和艺术")
-    
-    elif 'empire' in period_name.lower():
-        characteristics.append("大规模领土扩张")
-        characteristics.append("中央集权统治")
-        characteristics.append("多民族融合")
-    
-    elif 'republic' in period_name.lower():
-        characteristics.append("公民政治参与")
-        characteristics.append("法治传统")
-        characteristics.append("选举制度")
-    
-    elif 'kingdom' in period_name.lower():
-        characteristics.append("世袭君主制")
-        characteristics.append("封建等级制度")
-        characteristics.append("贵族统治")
-    
-    elif 'renaissance' in period_name.lower() or 'revival' in period_name.lower():
-        characteristics.append("文化复兴")
-        characteristics.append("人文主义兴起")
-        characteristics.append("艺术创新")
-    
-    elif 'industrial' in period_name.lower():
-        characteristics.append("工业化生产")
-        characteristics.append("技术革新")
-        characteristics.append("城市化进程")
+    characteristics = match_name_rules(period_name, ERA_RULES)
     
     # 基于事件的特征
     if events:
-        event_categories = []
-        for event in events:
-            category = event.get('category', '')
-            if category and category not in event_categories:
-                event_categories.append(category)
-        
-        if '政治变革' in event_categories:
-            characteristics.append("政治制度变革")
-        if '军事' in event_categories:
-            characteristics.append("军事冲突频繁")
-        if '文化艺术' in event_categories:
-            characteristics.append("文化艺术繁荣")
-        if '科技/生产力' in event_categories:
-            characteristics.append("科技进步显著")
-        if '经济' in event_categories:
-            characteristics.append("经济发展活跃")
+        event_categories = {event.get('category', '') for event in events}
+        for category, characteristic in CATEGORY_CHARACTERISTICS:
+            if category in event_categories:
+                characteristics.append(characteristic)
     
     return "; ".join(characteristics) if characteristics else "历史转型期"
 
@@ -109,77 +130,17 @@ def extract_key_legacy(period_name, period_data, events):
     """
     从时期数据中提取历史阶段和影响
     """
-    legacy_points = []
-    
     # 基于时期名称的历史影响
-    if 'minoan' in period_name.lower():
-        legacy_points.append("欧洲最早的城市文明雏形")
-        legacy_points.append("宫殿经济模式的开创者")
-        legacy_points.append("爱琴海文明的基础")
-    
-    elif 'mycenaean' in period_name.lower():
-        legacy_points.append("希腊古典文明的直接源头")
-        legacy_points.append("特洛伊战争的历史背景")
-        legacy_points.append("线性文字B的使用者")
-    
-    elif 'classical greece' in period_name.lower():
-        legacy_points.append("民主政治的诞生地")
-        legacy_points.append("哲学思想的黄金时代")
-        legacy_points.append("西方文明的基石")
-    
-    elif 'roman' in period_name.lower():
-        if 'republic' in period_name.lower():
-            legacy_points.append("共和政治制度的典范")
-            legacy_points.append("法治传统的建立")
-            legacy_points.append("公民权利概念的形成")
-        elif 'empire' in period_name.lower():
-            legacy_points.append("罗马和平的实现")
-            legacy_points.append("法律体系的完善")
-            legacy_points.append("基础设施建设的巅峰")
-    
-    elif 'migration period' in period_name.lower():
-        legacy_points.append("现代欧洲民族格局的形成")
-        legacy_points.append("古典文明向中世纪的过渡")
-        legacy_points.append("基督教在欧洲的传播")
-    
-    elif 'byzantine' in period_name.lower():
-        legacy_points.append("东罗马帝国的延续")
-        legacy_points.append("基督教东正教的形成")
-        legacy_points.append("古典文化的保护者")
-    
-    elif 'carolingian' in period_name.lower():
-        legacy_points.append("神圣罗马帝国的雏形")
-        legacy_points.append("加洛林文艺复兴")
-        legacy_points.append("欧洲统一的早期尝试")
-    
-    elif 'holy roman empire' in period_name.lower():
-        legacy_points.append("中世纪欧洲的政治秩序")
-        legacy_points.append("德意志民族国家的形成")
-        legacy_points.append("教皇与皇帝的权力斗争")
-    
-    elif 'french revolution' in period_name.lower():
-        legacy_points.append("现代民主革命的开端")
-        legacy_points.append("人权宣言的发表")
-        legacy_points.append("民族主义思想的传播")
+    legacy_points = match_name_rules(period_name, LEGACY_RULES)
     
     # 基于具体事件的影响
     if events:
         for event in events:
             event_name = event.get('event_name', '')
-            impact = event.get('impact', '')
-            
-            if '奥林匹克' in event_name:
-                legacy_points.append("奥林匹克运动传统的创立")
-            elif '梭伦' in event_name:
-                legacy_points.append("雅典民主政治的奠基")
-            elif '马拉松' in event_name:
-                legacy_points.append("希腊战胜波斯的标志性胜利")
-            elif '帕特农神庙' in event_name:
-                legacy_points.append("古典建筑艺术的巅峰")
-            elif '苏格拉底' in event_name:
-                legacy_points.append("西方哲学理性主义传统的开端")
-            elif '卢比孔河' in event_name:
-                legacy_points.append("罗马共和制的终结")
+            for keyword, legacy in EVENT_LEGACY.items():
+                if keyword in event_name:
+                    legacy_points.append(legacy)
+                    break
     
     return "; ".join(legacy_points) if legacy_points else "对后世产生深远影响"
 
@@ -191,8 +152,9 @@ def main():
     
     file_path = 'cache/European/euro_history3.json'
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            periods_data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        periods_data = orjson.loads(raw) if orjson else json.loads(raw)
     except FileNotFoundError:
         print(f"❌ 文件未找到: {file_path}")
         return
@@ -200,10 +162,20 @@ def main():
     print(f"📊 共找到 {len(periods_data)} 个历史时期")
 
     # 连接数据库
-    conn = sqlite3.connect('data.db')
+    # 关闭 sqlite3 模块的隐式事务管理，更新只有一次 BEGIN IMMEDIATE / COMMIT
+    conn = sqlite3.connect('data.db', isolation_level=None)
     cursor = conn.cursor()
+    # UPDATE 按 (period_name, start_year) 定位，与导入脚本共用同一个复合索引；
+    # 表里已有重复时期时建不了唯一索引，仍可退回 start_year 索引
+    try:
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_periods_name_start ON periods(period_name, start_year)')
+    except sqlite3.IntegrityError:
+        print("⚠️ periods 表存在重复的 (period_name, start_year)，未创建复合索引")
+
+    # 一次性取出已有时期，用集合判断是否存在，不再逐条依赖 rowcount
+    existing = set(cursor.execute('SELECT period_name, start_year FROM periods').fetchall())
 
-    updated_count = 0
+    rows = []
     not_found_count = 0
 
     for period_name, period_data in periods_data.items():
@@ -217,6 +189,11 @@ def main():
                 continue
         else:
             continue
+
+        if (period_name, start_year) not in existing:
+            print(f"⚠️ 未找到时期: {period_name} ({start_year})")
+            not_found_count += 1
+            continue
         
         # 获取事件列表
         events = period_data.get('events', [])
@@ -224,25 +201,27 @@ def main():
         # 提取特征和影响
         era_characteristics = extract_era_characteristics(period_name, period_data, events)
         key_legacy = extract_key_legacy(period_name, period_data, events)
-        
-        # 更新数据库
-        cursor.execute('''
+
+        print(f"✅ 更新时期: {period_name} ({start_year})")
+        print(f"   特征: {era_characteristics[:50]}...")
+        print(f"   影响: {key_legacy[:50]}...")
+        rows.append((era_characteristics, key_legacy, period_name, start_year))
+
+    # 所有更新在同一个事务里用 executemany 一次提交，出错时整体回滚
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        cursor.executemany('''
             UPDATE periods 
             SET era_characteristics = ?, key_legacy = ?
             WHERE period_name = ? AND start_year = ?
-        ''', (era_characteristics, key_legacy, period_name, start_year))
-        
-        if cursor.rowcount > 0:
-            print(f"✅ 更新时期: {period_name} ({start_year})")
-            print(f"   特征: {era_characteristics[:50]}...")
-            print(f"   影响: {key_legacy[:50]}...")
-            updated_count += 1
-        else:
-            print(f"⚠️ 未找到时期: {period_name} ({start_year})")
-            not_found_count += 1
-
-    conn.commit()
-    conn.close()
+        ''', rows)
+        conn.execute('COMMIT')
+    except sqlite3.Error:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    updated_count = len(rows)
 
     print("\n🎉 数据填充完成！")
     print(f"✅ 成功更新: {updated_count} 个时期")
@@ -5,11 +5,121 @@ This module provides functionality to scrape historical events from Wikipedia
 for European Timeline project.
 """
  
+import os
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 from datetime import datetime
-from cache_manager import CacheManager
+from email.utils import parsedate_to_datetime
+from cache_manager import CacheManager, ContentCache
+from rate_limiter import TokenBucket
+
+# Status codes Wikipedia uses to ask clients to back off
+RETRY_STATUS_CODES = (429, 503)
+MAX_RETRIES = 3
+
+# MediaWiki error codes (sent as HTTP 200 with an "error" body) worth retrying
+RETRY_API_ERRORS = ("maxlag", "ratelimited")
+
+# Gateway errors retried by urllib3 with a short backoff
+TRANSIENT_STATUS_CODES = (502, 504)
+
+# Keep-alive connections kept per host; sized above the generator's fetch
+# threads so concurrent requests reuse connections instead of discarding them
+POOL_MAXSIZE = 16
+
+# Requests per minute allowed across all threads (WIKIPEDIA_RPM, 0 disables);
+# cache hits do not count
+DEFAULT_WIKIPEDIA_RPM = 200
+
+# Query parameters shared by every request for a page's full plain text
+# (copied per request, with the title or page ID added)
+FULL_PAGE_PARAMS = {
+    'action': 'query',
+    'prop': 'extracts|categories|pageprops',
+    'exintro': False,
+    'explaintext': True,
+    'exsectionformat': 'wiki',
+    'cllimit': 500,
+    'ppprop': 'wikibase_item',
+    'format': 'json',
+    'origin': '*'
+}
+
+YEAR_PAGE_PARAMS = {
+    'action': 'query',
+    'prop': 'extracts|categories|revisions',
+    'exintro': False,
+    'explaintext': True,
+    'format': 'json',
+    'origin': '*'
+}
+
+# Search queries issued at once by search_historical_periods/events
+SEARCH_WORKERS = 4
+
+
+class WikipediaAPIError(Exception):
+    """MediaWiki API error reported in a successful HTTP response body."""
+
+    def __init__(self, code: str, info: str = ""):
+        """
+        Initialize the error.
+
+        Args:
+            code: MediaWiki error code (e.g. "maxlag", "badtitle")
+            info: Human-readable error description
+        """
+        super().__init__(f"Wikipedia API error {code}: {info}")
+        self.code = code
+        self.info = info
+
+
+def _retry_after_seconds(response: requests.Response, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a throttled request.
+
+    Args:
+        response: The 429/503 response
+        attempt: Zero-based retry attempt, used for backoff without a header
+
+    Returns:
+        Seconds to wait
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        # Either delta-seconds or an HTTP date
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return float(2 ** attempt)
+
+
+def _rate_limit_reset_seconds(response: requests.Response) -> float:
+    """
+    Seconds until the rate-limit window resets when a response reports it exhausted.
+
+    Args:
+        response: A successful response
+
+    Returns:
+        Seconds to wait (0 when requests remain or no reset is advertised)
+    """
+    if response.headers.get("X-RateLimit-Remaining") != "0":
+        return 0.0
+    try:
+        reset = float(response.headers.get("X-RateLimit-Reset", 0))
+    except ValueError:
+        return 0.0
+    # Reset is an epoch timestamp on most servers, a delta on some
+    return max(0.0, reset - time.time()) if reset > 1e9 else reset
 
 
 class WikipediaScraper:
@@ -28,8 +138,76 @@ class WikipediaScraper:
         self.language = language
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': user_agent})
+        # Retry dropped connections and transient gateway errors at the
+        # transport level; 429/503 are handled in _get_json so Retry-After
+        # and the shared rate limit are honoured there
+        self.session.mount("https://", HTTPAdapter(
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=TRANSIENT_STATUS_CODES, raise_on_status=False)
+        ))
         self.region = region
         self.cache = CacheManager()
+        self.content_cache = ContentCache()
+        # WIKIPEDIA_REFRESH=1 re-fetches every request (e.g. for a fresh pull in CI)
+        self.force_refresh = os.getenv("WIKIPEDIA_REFRESH") == "1"
+        rpm = int(os.getenv("WIKIPEDIA_RPM", DEFAULT_WIKIPEDIA_RPM))
+        self.rate_limiter = TokenBucket(rpm) if rpm else None
+
+    def _get_json(self, params: Dict, timeout: Optional[int] = None,
+                  force_refresh: bool = False) -> Dict:
+        """
+        Issue an API request, reusing the content-addressed cache.
+
+        Args:
+            params: API query parameters
+            timeout: Request timeout in seconds
+            force_refresh: Skip the cache lookup and re-fetch (always on with WIKIPEDIA_REFRESH=1)
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            WikipediaAPIError: The API answered with an error body (never cached)
+        """
+        key = ContentCache.make_key(self.api_url, params)
+        if not (force_refresh or self.force_refresh):
+            cached = self.content_cache.get(key)
+            if cached is not None:
+                return cached
+
+        # No fixed delay between requests: wait only for the shared rate
+        # limit or when the server asks to back off
+        for attempt in range(MAX_RETRIES + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self.session.get(self.api_url, params=params, timeout=timeout)
+            if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                wait = _retry_after_seconds(response, attempt)
+                print(f"Wikipedia returned {response.status_code}, retrying in {wait:.1f}s")
+                time.sleep(wait)
+                continue
+
+            response.raise_for_status()
+            data = response.json()
+            # API errors come back as HTTP 200; the transient ones are retried
+            # like a 429, and none of them may be cached
+            error = data.get("error") if isinstance(data, dict) else None
+            if not error:
+                break
+            if error.get("code") not in RETRY_API_ERRORS or attempt == MAX_RETRIES:
+                raise WikipediaAPIError(error.get("code", "unknown"), error.get("info", ""))
+            wait = _retry_after_seconds(response, attempt)
+            print(f"Wikipedia API error {error.get('code')}, retrying in {wait:.1f}s")
+            time.sleep(wait)
+
+        self.content_cache.put(key, data)
+
+        # Window exhausted: pause before the next request rather than hit a 429
+        wait = _rate_limit_reset_seconds(response)
+        if wait:
+            time.sleep(wait)
+        return data
 
     def search_pages(self, query: str, limit: int = 50) -> List[Dict]:
         """
@@ -52,14 +230,38 @@ class WikipediaScraper:
         }
 
         try:
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params)
             return data.get('query', {}).get('search', [])
         except Exception as e:
             print(f"Error searching Wikipedia: {e}")
             return []
 
+    def _search_unique(self, queries: List[str], limit: int = 10) -> List[Dict]:
+        """
+        Run several searches concurrently and merge their results.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+
+        Returns:
+            Page information dictionaries, deduplicated by page ID in query order
+        """
+        # Searches are independent and network-bound; the shared rate limiter
+        # in _get_json still paces the actual requests
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+            result_lists = list(executor.map(lambda query: self.search_pages(query, limit=limit), queries))
+
+        seen = set()
+        unique_results = []
+        for results in result_lists:
+            for result in results:
+                if result['pageid'] not in seen:
+                    seen.add(result['pageid'])
+                    unique_results.append(result)
+
+        return unique_results
+
     def get_page_content(self, page_id: int) -> Optional[Dict]:
         """
         Get the full content of a Wikipedia page.
@@ -70,23 +272,10 @@ class WikipediaScraper:
         Returns:
             Dictionary with page content including text, categories, etc.
         """
-        params = {
-            'action': 'query',
-            'prop': 'extracts|categories|pageprops',
-            'exintro': False,
-            'explaintext': True,
-            'exsectionformat': 'wiki',
-            'cllimit': 500,
-            'ppprop': 'wikibase_item',
-            'pageids': page_id,
-            'format': 'json',
-            'origin': '*'
-        }
+        params = {**FULL_PAGE_PARAMS, 'pageids': page_id}
 
         try:
-            response = self.session.get(self.api_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params, timeout=30)
             pages = data.get('query', {}).get('pages', {})
             return pages.get(str(page_id))
         except requests.exceptions.Timeout:
@@ -113,21 +302,7 @@ class WikipediaScraper:
             f"Timeline of {region} history"
         ]
 
-        all_periods = []
-        for query in queries:
-            results = self.search_pages(query, limit=10)
-            all_periods.extend(results)
-            time.sleep(0.5)  # Rate limiting
-
-        # Remove duplicates
-        seen = set()
-        unique_periods = []
-        for period in all_periods:
-            if period['pageid'] not in seen:
-                seen.add(period['pageid'])
-                unique_periods.append(period)
-
-        return unique_periods
+        return self._search_unique(queries)
 
     def search_historical_events(self, year_range: tuple, region: str = "European") -> List[Dict]:
         """
@@ -149,21 +324,7 @@ class WikipediaScraper:
             f"History of {region} {abs(start_year)} {'BC' if start_year < 0 else 'AD'}"
         ]
 
-        all_events = []
-        for query in queries:
-            results = self.search_pages(query, limit=10)
-            all_events.extend(results)
-            time.sleep(0.5)  # Rate limiting
-
-        # Remove duplicates
-        seen = set()
-        unique_events = []
-        for event in all_events:
-            if event['pageid'] not in seen:
-                seen.add(event['pageid'])
-                unique_events.append(event)
-
-        return unique_events
+        return self._search_unique(queries)
 
     def get_year_page(self, year: int, force_refresh: bool = False) -> Optional[Dict]:
         """
@@ -193,20 +354,10 @@ class WikipediaScraper:
             else:
                 page_title = str(year)
 
-        params = {
-            'action': 'query',
-            'prop': 'extracts|categories|revisions',
-            'exintro': False,
-            'explaintext': True,
-            'titles': page_title,
-            'format': 'json',
-            'origin': '*'
-        }
+        params = {**YEAR_PAGE_PARAMS, 'titles': page_title}
 
         try:
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params, force_refresh=force_refresh)
             pages = data.get('query', {}).get('pages', {})
 
             # Find the page ID (might be -1 if page doesn't exist)
@@ -242,23 +393,10 @@ class WikipediaScraper:
                 return cached_data
 
         # Not cached or force refresh - scrape from Wikipedia
-        params = {
-            'action': 'query',
-            'prop': 'extracts|categories|pageprops',
-            'exintro': False,
-            'explaintext': True,
-            'exsectionformat': 'wiki',
-            'cllimit': 500,
-            'ppprop': 'wikibase_item',
-            'titles': dynasty_name,
-            'format': 'json',
-            'origin': '*'
-        }
+        params = {**FULL_PAGE_PARAMS, 'titles': dynasty_name}
 
         try:
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(params, force_refresh=force_refresh)
             pages = data.get('query', {}).get('pages', {})
 
             # Find page ID (might be -1 if page doesn't exist)